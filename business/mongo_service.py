@@ -3,7 +3,7 @@ MongoDB Service
 Business logic layer for MongoDB operations and data orchestration.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union
 from data.mongo_connection import MongoConnection
 from data.mongo_repository import MongoRepository
 import logging
@@ -148,7 +148,7 @@ class MongoService:
             return {"count": 0, "stats": {}}
     
     def find_documents(self, database_name: str, collection_name: str, 
-                      query: str = None, limit: int = 100, 
+                      query: Union[str, Dict[str, Any]] = None, limit: int = 100, 
                       skip: int = 0, sort: List[Tuple[str, int]] = None) -> List[Dict[str, Any]]:
         """
         Find documents in a collection with pagination support.
@@ -156,7 +156,7 @@ class MongoService:
         Args:
             database_name: Name of the database
             collection_name: Name of the collection
-            query: JSON string query filter
+            query: JSON string query filter, or an already parsed filter dict
             limit: Maximum number of documents
             skip: Number of documents to skip (for pagination)
             sort: List of (field, direction) tuples for sorting (1=asc, -1=desc)
@@ -170,7 +170,9 @@ class MongoService:
         try:
             # Parse query string to dict if provided
             query_dict = None
-            if query and query.strip():
+            if isinstance(query, dict):
+                query_dict = query
+            elif query and query.strip():
                 import json
                 query_dict = json.loads(query)
             
@@ -185,14 +187,15 @@ class MongoService:
             return []
     
     def count_documents(self, database_name: str, collection_name: str, 
-                       query: str = None) -> int:
+                       query: Union[str, Dict[str, Any]] = None, exact: bool = False) -> int:
         """
         Count documents in a collection.
         
         Args:
             database_name: Name of the database
             collection_name: Name of the collection
-            query: JSON string query filter
+            query: JSON string query filter, or an already parsed filter dict
+            exact: Count every document instead of estimating an unfiltered total
             
         Returns:
             Number of documents
@@ -203,11 +206,13 @@ class MongoService:
         try:
             # Parse query string to dict if provided
             query_dict = None
-            if query and query.strip():
+            if isinstance(query, dict):
+                query_dict = query
+            elif query and query.strip():
                 import json
                 query_dict = json.loads(query)
             
-            return self._repository.count_documents(database_name, collection_name, query_dict)
+            return self._repository.count_documents(database_name, collection_name, query_dict, exact)
         except json.JSONDecodeError:
             logger.error("Invalid JSON query format")
             return 0
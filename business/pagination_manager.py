@@ -8,11 +8,39 @@ from __future__ import annotations
 import logging
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
+from datetime import datetime
 from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
 
+def id_sort_bracket(value: Any) -> str:
+    """
+    Name the BSON type bracket a value sorts and compares in.
+    
+    MongoDB orders mixed types bracket by bracket (numbers, then strings,
+    objects, ..., ObjectIds, booleans, dates), and a range such as
+    {"$gt": value} only matches values in the same bracket as value.
+    
+    Args:
+        value: An _id value
+        
+    Returns:
+        Bracket name; all numeric types share the "number" bracket
+    """
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, (int, float)) or type(value).__name__ == "Decimal128":
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, dict):
+        return "object"
+    if isinstance(value, datetime):
+        return "date"
+    return type(value).__name__
+
+
 @dataclass
 class PageInfo:
     """Information about a specific page of documents."""
@@ -43,6 +71,13 @@ class PaginationManager:
         # Cache for loaded pages (page_number -> documents)
         self._page_cache: OrderedDict[int, List[Dict[str, Any]]] = OrderedDict()
         
+        # Last _id of each loaded page (page_number -> _id); pages are fetched
+        # in _id order, so the next page can start after it instead of skipping
+        self._page_cursors: Dict[int, Any] = {}
+        # The one type bracket every _id of the current results is in, or
+        # None when unknown or mixed; cursors are only used within it
+        self._id_bracket: Optional[str] = None
+        
         # Current page information
         self._current_page = 1
         self._total_documents = 0
@@ -158,12 +193,45 @@ class PaginationManager:
             logger.debug(f"Removed page {oldest_page} from cache (cache full)")
         
         self._page_cache[page_number] = documents
+        last_document = documents[-1] if documents else None
+        if isinstance(last_document, dict) and "_id" in last_document:
+            self._page_cursors[page_number] = last_document["_id"]
         logger.debug(f"Cached page {page_number} with {len(documents)} documents")
     
+    def get_page_cursor(self, page_number: int) -> Optional[Any]:
+        """
+        Get the _id a page starts after, if the page before it was loaded.
+        
+        An _id range only matches _ids of the cursor's own type bracket, so
+        a cursor is only given out while every _id is known to be in it.
+        
+        Args:
+            page_number: Page number about to be fetched
+            
+        Returns:
+            Last _id of the previous page, or None if it is unknown or the
+            page has to be fetched with skip
+        """
+        cursor = self._page_cursors.get(page_number - 1)
+        if cursor is None or self._id_bracket is None or id_sort_bracket(cursor) != self._id_bracket:
+            return None
+        return cursor
+    
+    def set_id_bracket(self, bracket: Optional[str]) -> None:
+        """
+        Record the type bracket shared by every _id of the current results.
+        
+        Args:
+            bracket: Result of id_sort_bracket() for all _ids, or None when
+                they are mixed or not known
+        """
+        self._id_bracket = bracket
+    
     def clear_cache(self) -> None:
         """Clear all cached pages."""
         cache_size = len(self._page_cache)
         self._page_cache.clear()
+        self._page_cursors.clear()
         logger.info(f"Cleared pagination cache ({cache_size} pages)")
     
     def clear_cache_for_query(self, query: str, sort: List[Tuple[str, int]] = None) -> None:
@@ -177,8 +245,10 @@ class PaginationManager:
         if query != self._current_query or sort != self._current_sort:
             cache_size = len(self._page_cache)
             self._page_cache.clear()
+            self._page_cursors.clear()
             self._current_query = query
             self._current_sort = sort
+            self._id_bracket = None
             logger.info(f"Query/sort changed, cleared pagination cache ({cache_size} pages)")
     
     def get_cache_stats(self) -> Dict[str, Any]:
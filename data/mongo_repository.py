@@ -127,6 +127,10 @@ class MongoRepository:
                 cursor = cursor.skip(skip)
             
             cursor = cursor.limit(limit)
+            if limit > 0:
+                # Return the whole page in the first batch instead of the
+                # server's default 101 documents followed by getMore calls
+                cursor = cursor.batch_size(limit)
             
             documents = list(cursor)
             logger.debug(f"Retrieved {len(documents)} documents from {collection_name} "
@@ -138,14 +142,19 @@ class MongoRepository:
             return []
     
     def count_documents(self, database_name: str, collection_name: str, 
-                       query: Dict[str, Any] = None) -> int:
+                       query: Dict[str, Any] = None, exact: bool = False) -> int:
         """
         Count documents in a collection efficiently.
         
+        Without a filter the count comes from the collection metadata
+        (estimated_document_count), which does not scan the collection;
+        filtered counts still run count_documents.
+        
         Args:
             database_name: Name of the database
             collection_name: Name of the collection
             query: MongoDB query filter
+            exact: Count an unfiltered collection with count_documents too
             
         Returns:
             Number of documents
@@ -154,8 +163,15 @@ class MongoRepository:
             db = self._client[database_name]
             collection = db[collection_name]
             
-            if query is None:
-                query = {}
+            if not query and not exact:
+                try:
+                    count = collection.estimated_document_count()
+                    logger.debug(f"Collection {collection_name} has about {count} documents")
+                    return count
+                except PyMongoError as e:
+                    # Not every namespace supports metadata counts; count exactly
+                    logger.debug(f"Estimated count unavailable for {collection_name}: {e}")
+            query = query or {}
             
             count = collection.count_documents(query)
             logger.debug(f"Collection {collection_name} has {count} documents")
@@ -3,6 +3,8 @@ Dialog Components
 Custom dialogs for database operations and other functionality.
 """
 
+import logging
+
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
     QPushButton, QComboBox, QTextEdit, QFormLayout, QMessageBox,
@@ -16,6 +18,8 @@ from .dialog_helper import DialogHelper
 from ..styles.styles import BUTTON_STYLES
 from .dialog_logger import log_dialog_creation, log_dialog_result
 
+logger = logging.getLogger(__name__)
+
 
 class CreateDatabaseDialog(QDialog):
     """Dialog for creating a new database."""
@@ -90,8 +94,6 @@ class CreateDatabaseDialog(QDialog):
         self.create_btn.setEnabled(is_valid)
         
         # Log validation result
-        import logging
-        logger = logging.getLogger(__name__)
         logger.debug(f"Database name validation: '{db_name}' -> Valid: {is_valid}")
         
     def accept_dialog(self):
@@ -113,8 +115,6 @@ class CreateDatabaseDialog(QDialog):
         self.database_name = db_name
         
         # Log successful acceptance
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info(f"[DIALOG: Create Database] → Confirmed with database: {db_name}")
         
         self.accept()
@@ -129,12 +129,8 @@ class CreateDatabaseDialog(QDialog):
         
         # Log the result
         if result == QDialog.Accepted:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.info(f"[DIALOG: Create Database] → Accepted with database: '{self.database_name}'")
         else:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.info(f"[DIALOG: Create Database] → Cancelled by user")
         
         log_dialog_result(self, result)
@@ -1034,9 +1030,6 @@ class ConnectionDialog(QDialog):
         
     def test_connection(self):
         """Test the MongoDB connection."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         connection_string = self.connection_edit.text().strip()
         if not connection_string:
             MessageBoxHelper.warning(self, "Warning", "Please enter a connection string.")
@@ -7,102 +7,230 @@ from __future__ import annotations
 
 import json
 import logging
+import math
+import re
 from typing import Any, Dict, List, Optional, Tuple
 
 import qtawesome as fa
-from PySide6.QtCore import QObject, QTimer, Signal, Qt
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from PySide6.QtCore import QObject, QStringListModel, QTimer, Signal, Qt
 from PySide6.QtGui import QFont, QTextCharFormat, QSyntaxHighlighter, QColor, QPalette
 from PySide6.QtWidgets import (
     QComboBox, QCompleter, QFormLayout, QGroupBox, QHBoxLayout, QLabel, 
-    QLineEdit, QPushButton, QSizePolicy, QSpinBox, QTabWidget, QTextEdit,
+    QLineEdit, QPushButton, QSizePolicy, QTabWidget, QTextEdit,
     QVBoxLayout, QWidget, QCheckBox, QFrame, QScrollArea, QToolButton,
-    QMessageBox, QApplication
+    QApplication
 )
 
 from ..styles.styles import BUTTON_STYLES, COLORS
 
+# Stylesheets are formatted once rather than on every widget creation
+_FILTER_FRAME_QSS = f"""
+    QFrame {{
+        border: 1px solid {COLORS['border_light']};
+        border-radius: 6px;
+        background-color: {COLORS['bg_secondary']};
+        padding: 8px;
+    }}
+"""
+_FILTER_LABEL_QSS = f"color: {COLORS['text_primary']}; font-family: monospace;"
+_NO_FILTERS_LABEL_QSS = f"color: {COLORS['text_muted']}; font-style: italic;"
+_HELP_LABEL_QSS = f"color: {COLORS['text_secondary']}; font-size: 11px;"
+_STATUS_LABEL_QSS = f"color: {COLORS['danger']};"
+
+# Created on first use since icons need a running QApplication
+_REMOVE_ICON = None
+
+
+def _remove_icon():
+    """Return the shared remove-filter icon."""
+    global _REMOVE_ICON
+    if _REMOVE_ICON is None:
+        _REMOVE_ICON = fa.icon('fa6s.xmark', color=COLORS['danger'])
+    return _REMOVE_ICON
+
+
+# Quick filter templates: (button label, JSON text, parsed filter)
+_TEMPLATES = [
+    (label, template, json.loads(template))
+    for label, template in (
+        ("Find by ID", '{"_id": "document_id"}'),
+        ("Find by Date Range", '{"created_at": {"$gte": "2024-01-01", "$lte": "2024-12-31"}}'),
+        ("Find by Status", '{"status": "active"}'),
+        ("Find Empty Fields", '{"field_name": {"$exists": true, "$in": [null, "", []]}}'),
+    )
+]
+
+
+def _build_formats() -> Tuple[QTextCharFormat, ...]:
+    """Build the shared JSON highlighting formats."""
+    key_format = QTextCharFormat()
+    key_format.setForeground(QColor("#0366d6"))
+    key_format.setFontWeight(QFont.Bold)
+    
+    string_format = QTextCharFormat()
+    string_format.setForeground(QColor("#032f62"))
+    
+    number_format = QTextCharFormat()
+    number_format.setForeground(QColor("#005cc5"))
+    
+    operator_format = QTextCharFormat()
+    operator_format.setForeground(QColor("#d73a49"))
+    operator_format.setFontWeight(QFont.Bold)
+    
+    error_format = QTextCharFormat()
+    error_format.setBackground(QColor("#ffebee"))
+    error_format.setForeground(QColor("#c62828"))
+    
+    return key_format, string_format, number_format, operator_format, error_format
+
+
+# Formats are built once at import and shared by every highlighter instance
+_KEY_FMT, _STR_FMT, _NUM_FMT, _OP_FMT, _ERR_FMT = _build_formats()
+_PLAIN_FMT = QTextCharFormat()
+
+# JSON token patterns used by the highlighter
+_KEY_RE = re.compile(r'"([^"]+)"\s*:')
+_STRING_RE = re.compile(r':\s*"([^"]*)"')
+_NUMBER_RE = re.compile(r':\s*(\d+(?:\.\d+)?)')
+_OPERATOR_RE = re.compile(r'\$[a-zA-Z]+')
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a filter to compact JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """Parse a numeric filter value, returning None when it is not a finite number."""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+def _numeric_op(mongo_op: str):
+    """Build a handler for a numeric comparison operator."""
+    def handler(value: str) -> Any:
+        number = _to_float(value)
+        return {mongo_op: number} if number is not None else None
+    return handler
+
+
+def _list_op(mongo_op: str):
+    """Build a handler for a comma-separated list operator."""
+    def handler(value: str) -> Any:
+        return {mongo_op: [v.strip() for v in value.split(',')]} if value else None
+    return handler
+
+
+# Human-readable operator -> MongoDB expression builder
+_OP_HANDLERS = {
+    "equals": lambda v: v if v else None,
+    "not equals": lambda v: {"$ne": v} if v else {"$ne": None},
+    "contains": lambda v: {"$regex": v, "$options": "i"} if v else None,
+    "starts with": lambda v: {"$regex": f"^{v}", "$options": "i"} if v else None,
+    "ends with": lambda v: {"$regex": f"{v}$", "$options": "i"} if v else None,
+    "greater than": _numeric_op("$gt"),
+    "less than": _numeric_op("$lt"),
+    "greater than or equal": _numeric_op("$gte"),
+    "less than or equal": _numeric_op("$lte"),
+    "in list": _list_op("$in"),
+    "not in list": _list_op("$nin"),
+    "exists": lambda v: {"$exists": True},
+    "regex": lambda v: {"$regex": v, "$options": "i"} if v else None,
+}
+
 
 class JSONSyntaxHighlighter(QSyntaxHighlighter):
     """Syntax highlighter for JSON text with error highlighting."""
     
+    key_format = _KEY_FMT
+    string_format = _STR_FMT
+    number_format = _NUM_FMT
+    operator_format = _OP_FMT
+    error_format = _ERR_FMT
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.error_line = -1
         self.error_message = ""
-        
-        # Define formats
-        self.key_format = QTextCharFormat()
-        self.key_format.setForeground(QColor("#0366d6"))
-        self.key_format.setFontWeight(QFont.Bold)
-        
-        self.string_format = QTextCharFormat()
-        self.string_format.setForeground(QColor("#032f62"))
-        
-        self.number_format = QTextCharFormat()
-        self.number_format.setForeground(QColor("#005cc5"))
-        
-        self.operator_format = QTextCharFormat()
-        self.operator_format.setForeground(QColor("#d73a49"))
-        self.operator_format.setFontWeight(QFont.Bold)
-        
-        self.error_format = QTextCharFormat()
-        self.error_format.setBackground(QColor("#ffebee"))
-        self.error_format.setForeground(QColor("#c62828"))
+        self._error_block = None
         
     def highlightBlock(self, text: str):
         """Highlight a block of text."""
+        # Bind hot lookups once per block rather than once per match
+        set_fmt = self.setFormat
+        key_format = self.key_format
+        string_format = self.string_format
+        number_format = self.number_format
+        operator_format = self.operator_format
+        
         # Reset formatting
-        self.setFormat(0, len(text), QTextCharFormat())
+        set_fmt(0, len(text), _PLAIN_FMT)
         
         # Highlight keys (quoted strings followed by colon)
-        import re
-        key_pattern = r'"([^"]+)"\s*:'
-        for match in re.finditer(key_pattern, text):
-            self.setFormat(match.start(1), match.end(1) - match.start(1), self.key_format)
+        for match in _KEY_RE.finditer(text):
+            start, end = match.span(1)
+            set_fmt(start, end - start, key_format)
             
         # Highlight string values
-        string_pattern = r':\s*"([^"]*)"'
-        for match in re.finditer(string_pattern, text):
-            self.setFormat(match.start(1), match.end(1) - match.start(1), self.string_format)
+        for match in _STRING_RE.finditer(text):
+            start, end = match.span(1)
+            set_fmt(start, end - start, string_format)
             
         # Highlight numbers
-        number_pattern = r':\s*(\d+(?:\.\d+)?)'
-        for match in re.finditer(number_pattern, text):
-            self.setFormat(match.start(1), match.end(1) - match.start(1), self.number_format)
+        for match in _NUMBER_RE.finditer(text):
+            start, end = match.span(1)
+            set_fmt(start, end - start, number_format)
             
         # Highlight operators
-        operator_pattern = r'\$[a-zA-Z]+'
-        for match in re.finditer(operator_pattern, text):
-            self.setFormat(match.start(), match.end() - match.start(), self.operator_format)
+        for match in _OPERATOR_RE.finditer(text):
+            start, end = match.span()
+            set_fmt(start, end - start, operator_format)
             
         # Highlight error line if specified
         if self.error_line >= 0:
             line_number = self.currentBlock().blockNumber()
             if line_number == self.error_line:
-                self.setFormat(0, len(text), self.error_format)
+                set_fmt(0, len(text), self.error_format)
     
     def set_error(self, line: int, message: str):
         """Set error highlighting for a specific line."""
         if self.error_line != line or self.error_message != message:
+            new_block = self.document().findBlockByNumber(line)
+            old_block = self._error_block
             self.error_line = line
             self.error_message = message
-            # Use a timer to prevent recursion
-            QTimer.singleShot(0, self.rehighlight)
+            self._error_block = new_block if new_block.isValid() else None
+            # Only the previously and newly errored blocks need repainting
+            if old_block is not None and old_block.isValid() and old_block != new_block:
+                self.rehighlightBlock(old_block)
+            if self._error_block is not None:
+                self.rehighlightBlock(self._error_block)
     
     def clear_error(self):
         """Clear error highlighting."""
         if self.error_line != -1 or self.error_message:
+            old_block = self._error_block
             self.error_line = -1
             self.error_message = ""
-            # Use a timer to prevent recursion
-            QTimer.singleShot(0, self.rehighlight)
+            self._error_block = None
+            if old_block is not None and old_block.isValid():
+                self.rehighlightBlock(old_block)
 
 
 class AdvancedFilterPanel(QObject):
     """Advanced filter panel component with basic and advanced modes."""
     
     # Signals
-    filter_applied = Signal(str, int)  # Emits filter JSON, limit
+    filter_applied = Signal(object)  # Emits parsed filter dict
     filter_reset = Signal()
     
     def __init__(self, parent: QObject | None = None) -> None:
@@ -121,20 +249,37 @@ class AdvancedFilterPanel(QObject):
         self.value_input: QLineEdit | None = None
         self.add_filter_btn: QPushButton | None = None
         self.active_filters_frame: QFrame | None = None
+        self._no_filters_label: QLabel | None = None
+        self._filter_item_widgets: List[QWidget] = []
         
         # Advanced mode components
         self.json_editor: QTextEdit | None = None
         self.syntax_highlighter: JSONSyntaxHighlighter | None = None
+        self._advanced_built = False
+        self._filtering_enabled = True
         
         # Common components
-        self.limit_spinbox: QSpinBox | None = None
         self.apply_btn: QPushButton | None = None
         self.reset_btn: QPushButton | None = None
+        self._status_label: QLabel | None = None
         
         # Data
         self.available_fields: List[str] = []
         self.active_filters: List[Dict[str, Any]] = []
         self.field_values_cache: Dict[str, List[str]] = {}
+        self._value_completers: Dict[str, QCompleter] = {}
+        
+        # Field names live in one model shared by the combo and its completer
+        self._field_model = QStringListModel(self)
+        self._field_completer = QCompleter(self._field_model, self)
+        self._field_completer.setCaseSensitivity(Qt.CaseInsensitive)
+        self._field_completer.setFilterMode(Qt.MatchContains)
+        
+        # Debounce value suggestion updates while the field name is typed
+        self._field_change_timer = QTimer(self)
+        self._field_change_timer.setSingleShot(True)
+        self._field_change_timer.setInterval(80)
+        self._field_change_timer.timeout.connect(self._on_field_change_timeout)
         
         # Setup
         self._create_filter_panel()
@@ -168,12 +313,23 @@ class AdvancedFilterPanel(QObject):
         self.basic_widget = self._create_basic_mode()
         self.mode_tabs.addTab(self.basic_widget, "Basic Mode")
         
-        # Advanced mode tab
-        self.advanced_widget = self._create_advanced_mode()
+        # Advanced mode tab; the editor is built the first time the tab is shown
+        self.advanced_widget = QWidget()
+        advanced_layout = QVBoxLayout(self.advanced_widget)
+        advanced_layout.setContentsMargins(0, 0, 0, 0)
         self.mode_tabs.addTab(self.advanced_widget, "Advanced Mode")
+        self.mode_tabs.currentChanged.connect(self._lazy_init_advanced)
         
         parent_layout.addWidget(self.mode_tabs)
     
+    def _lazy_init_advanced(self, index: int) -> None:
+        """Build the advanced mode editor on first switch to its tab."""
+        if index != 1 or self._advanced_built:
+            return
+        self._advanced_built = True
+        self.advanced_widget.layout().addWidget(self._create_advanced_mode())
+        self.json_editor.setEnabled(self._filtering_enabled)
+    
     def _create_basic_mode(self) -> QWidget:
         """Create the basic filtering mode widget."""
         widget = QWidget()
@@ -224,14 +380,14 @@ class AdvancedFilterPanel(QObject):
         
         self.active_filters_frame = QFrame()
         self.active_filters_frame.setFrameStyle(QFrame.StyledPanel)
-        self.active_filters_frame.setStyleSheet(f"""
-            QFrame {{
-                border: 1px solid {COLORS['border_light']};
-                border-radius: 6px;
-                background-color: {COLORS['bg_secondary']};
-                padding: 8px;
-            }}
-        """)
+        self.active_filters_frame.setStyleSheet(_FILTER_FRAME_QSS)
+        
+        filters_layout = QVBoxLayout(self.active_filters_frame)
+        filters_layout.setSpacing(4)
+        
+        self._no_filters_label = QLabel("No active filters")
+        self._no_filters_label.setStyleSheet(_NO_FILTERS_LABEL_QSS)
+        filters_layout.addWidget(self._no_filters_label)
         
         self._update_active_filters_display()
         active_layout.addWidget(self.active_filters_frame)
@@ -260,7 +416,7 @@ class AdvancedFilterPanel(QObject):
             '• {"status": {"$in": ["active", "pending"]}} - Find documents with status in list'
         )
         help_label.setWordWrap(True)
-        help_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 11px;")
+        help_label.setStyleSheet(_HELP_LABEL_QSS)
         editor_layout.addWidget(help_label)
         
         # JSON editor
@@ -286,24 +442,6 @@ class AdvancedFilterPanel(QObject):
         controls_layout = QFormLayout(controls_group)
         controls_layout.setSpacing(8)
         
-        # Limit input
-        limit_layout = QHBoxLayout()
-        limit_layout.setSpacing(8)
-        
-        limit_label = QLabel("Limit:")
-        limit_label.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
-        limit_label.setMinimumHeight(24)
-        
-        self.limit_spinbox = QSpinBox()
-        self.limit_spinbox.setRange(1, 10000)
-        self.limit_spinbox.setValue(100)
-        self.limit_spinbox.setMinimumHeight(24)
-        
-        limit_layout.addWidget(limit_label)
-        limit_layout.addWidget(self.limit_spinbox)
-        limit_layout.addStretch()
-        controls_layout.addRow("", limit_layout)
-        
         # Action buttons
         button_layout = QHBoxLayout()
         button_layout.setSpacing(8)
@@ -318,8 +456,17 @@ class AdvancedFilterPanel(QObject):
         self.reset_btn.setMinimumHeight(28)
         self.reset_btn.clicked.connect(self._reset_filter)
         
+        # Inline validation status; avoids a modal dialog on bad input
+        self._status_label = QLabel("")
+        self._status_label.setStyleSheet(_STATUS_LABEL_QSS)
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(3000)
+        self._status_timer.timeout.connect(self._status_label.clear)
+        
         button_layout.addWidget(self.apply_btn)
         button_layout.addWidget(self.reset_btn)
+        button_layout.addWidget(self._status_label)
         button_layout.addStretch()
         
         controls_layout.addRow("", button_layout)
@@ -335,34 +482,13 @@ class AdvancedFilterPanel(QObject):
         # Template buttons
         templates_btn_layout = QHBoxLayout()
         
-        # Find by ID template
-        id_btn = QPushButton("Find by ID")
-        id_btn.setStyleSheet(BUTTON_STYLES['dialog_neutral'])
-        id_btn.setMinimumHeight(24)
-        id_btn.clicked.connect(lambda: self._apply_template('{"_id": "document_id"}'))
-        
-        # Find by Date Range template
-        date_btn = QPushButton("Find by Date Range")
-        date_btn.setStyleSheet(BUTTON_STYLES['dialog_neutral'])
-        date_btn.setMinimumHeight(24)
-        date_btn.clicked.connect(lambda: self._apply_template('{"created_at": {"$gte": "2024-01-01", "$lte": "2024-12-31"}}'))
-        
-        # Find by Status template
-        status_btn = QPushButton("Find by Status")
-        status_btn.setStyleSheet(BUTTON_STYLES['dialog_neutral'])
-        status_btn.setMinimumHeight(24)
-        status_btn.clicked.connect(lambda: self._apply_template('{"status": "active"}'))
-        
-        # Find Empty Fields template
-        empty_btn = QPushButton("Find Empty Fields")
-        empty_btn.setStyleSheet(BUTTON_STYLES['dialog_neutral'])
-        empty_btn.setMinimumHeight(24)
-        empty_btn.clicked.connect(lambda: self._apply_template('{"field_name": {"$exists": true, "$in": [null, "", []]}}'))
-        
-        templates_btn_layout.addWidget(id_btn)
-        templates_btn_layout.addWidget(date_btn)
-        templates_btn_layout.addWidget(status_btn)
-        templates_btn_layout.addWidget(empty_btn)
+        for label, template, parsed in _TEMPLATES:
+            btn = QPushButton(label)
+            btn.setStyleSheet(BUTTON_STYLES['dialog_neutral'])
+            btn.setMinimumHeight(24)
+            btn.clicked.connect(lambda checked=False, t=template, d=parsed: self._apply_template(t, d))
+            templates_btn_layout.addWidget(btn)
+        
         templates_btn_layout.addStretch()
         
         templates_layout.addLayout(templates_btn_layout)
@@ -372,20 +498,31 @@ class AdvancedFilterPanel(QObject):
         """Setup autocomplete for field names and values."""
         if self.field_combo:
             # Field name autocomplete
-            self.field_combo.setCompleter(QCompleter(self.available_fields))
+            self.field_combo.setModel(self._field_model)
+            self.field_combo.setCompleter(self._field_completer)
             
             # Connect field selection to value suggestions
-            self.field_combo.currentTextChanged.connect(self._on_field_changed)
+            self.field_combo.currentTextChanged.connect(self._schedule_field_changed)
+    
+    def _schedule_field_changed(self, _field_name: str) -> None:
+        """Restart the debounce timer for value suggestion updates."""
+        self._field_change_timer.start()
+    
+    def _on_field_change_timeout(self) -> None:
+        """Update value suggestions once the field name has settled."""
+        if self.field_combo:
+            self._on_field_changed(self.field_combo.currentText())
     
     def _on_field_changed(self, field_name: str) -> None:
         """Handle field selection change to update value suggestions."""
-        if field_name and field_name in self.field_values_cache:
-            # Update value input with suggestions
-            values = self.field_values_cache[field_name]
-            if values:
-                # Create a completer for the values
-                completer = QCompleter(values)
-                self.value_input.setCompleter(completer)
+        completer = self._value_completers.get(field_name)
+        if completer is None and self.field_values_cache.get(field_name):
+            # Create the completer for this field's values once and reuse it
+            completer = QCompleter(self.field_values_cache[field_name])
+            completer.setCaseSensitivity(Qt.CaseInsensitive)
+            self._value_completers[field_name] = completer
+        if completer is not None:
+            self.value_input.setCompleter(completer)
     
     def _add_basic_filter(self) -> None:
         """Add a basic filter from the form."""
@@ -394,7 +531,7 @@ class AdvancedFilterPanel(QObject):
         value = self.value_input.text().strip()
         
         if not field:
-            QMessageBox.warning(self.widget, "Validation Error", "Please enter a field name.")
+            self._show_status("Please enter a field name.")
             return
         
         # Convert operator to MongoDB syntax
@@ -404,85 +541,57 @@ class AdvancedFilterPanel(QObject):
         if mongo_operator:
             filter_dict = {field: mongo_operator}
             self.active_filters.append(filter_dict)
-            self._update_active_filters_display()
+            self._append_filter_item(filter_dict)
             
             # Clear inputs
             self.value_input.clear()
             
             self.logger.info(f"Added basic filter: {field} {operator} {value}")
         else:
-            QMessageBox.warning(self.widget, "Validation Error", f"Invalid operator combination: {operator}")
+            self._show_status(f"Invalid operator combination: {operator}")
+    
+    def _show_status(self, message: str) -> None:
+        """Show a validation message next to the action buttons for a few seconds."""
+        self._status_label.setText(message)
+        self._status_timer.start()
     
     def _convert_operator_to_mongo(self, operator: str, value: str) -> Any:
         """Convert human-readable operator to MongoDB syntax."""
-        if operator == "equals":
-            return value if value else None
-        elif operator == "not equals":
-            return {"$ne": value} if value else {"$ne": None}
-        elif operator == "contains":
-            return {"$regex": value, "$options": "i"} if value else None
-        elif operator == "starts with":
-            return {"$regex": f"^{value}", "$options": "i"} if value else None
-        elif operator == "ends with":
-            return {"$regex": f"{value}$", "$options": "i"} if value else None
-        elif operator == "greater than":
-            return {"$gt": float(value)} if value and value.replace('.', '').isdigit() else None
-        elif operator == "less than":
-            return {"$lt": float(value)} if value and value.replace('.', '').isdigit() else None
-        elif operator == "greater than or equal":
-            return {"$gte": float(value)} if value and value.replace('.', '').isdigit() else None
-        elif operator == "less than or equal":
-            return {"$lte": float(value)} if value and value.replace('.', '').isdigit() else None
-        elif operator == "in list":
-            if value:
-                values = [v.strip() for v in value.split(',')]
-                return {"$in": values}
-            return None
-        elif operator == "not in list":
-            if value:
-                values = [v.strip() for v in value.split(',')]
-                return {"$nin": values}
-            return None
-        elif operator == "exists":
-            return {"$exists": True}
-        elif operator == "regex":
-            return {"$regex": value, "$options": "i"} if value else None
-        
-        return None
+        handler = _OP_HANDLERS.get(operator)
+        return handler(value) if handler else None
     
     def _update_active_filters_display(self) -> None:
-        """Update the display of active filters."""
+        """Rebuild the display of active filters from scratch."""
         if not self.active_filters_frame:
             return
         
-        # Clear existing widgets and layout
-        for child in self.active_filters_frame.children():
-            if isinstance(child, QWidget):
-                child.deleteLater()
-        
-        # Get the existing layout or create a new one
-        existing_layout = self.active_filters_frame.layout()
-        if existing_layout:
-            # Clear the existing layout
-            while existing_layout.count():
-                item = existing_layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-        else:
-            # Create new layout if none exists
-            existing_layout = QVBoxLayout(self.active_filters_frame)
-            existing_layout.setSpacing(4)
+        while self._filter_item_widgets:
+            self._remove_filter_item(len(self._filter_item_widgets) - 1)
         
-        if not self.active_filters:
-            no_filters_label = QLabel("No active filters")
-            no_filters_label.setStyleSheet(f"color: {COLORS['text_muted']}; font-style: italic;")
-            existing_layout.addWidget(no_filters_label)
-        else:
-            for i, filter_dict in enumerate(self.active_filters):
-                filter_widget = self._create_filter_item_widget(filter_dict, i)
-                existing_layout.addWidget(filter_widget)
+        for filter_dict in self.active_filters:
+            self._append_filter_item(filter_dict)
+        
+        self._no_filters_label.setVisible(not self.active_filters)
     
-    def _create_filter_item_widget(self, filter_dict: Dict[str, Any], index: int) -> QWidget:
+    def _append_filter_item(self, filter_dict: Dict[str, Any]) -> None:
+        """Append a single filter item to the active filters display."""
+        if not self.active_filters_frame:
+            return
+        
+        filter_widget = self._create_filter_item_widget(filter_dict)
+        self._filter_item_widgets.append(filter_widget)
+        self.active_filters_frame.layout().addWidget(filter_widget)
+        self._no_filters_label.setVisible(False)
+    
+    def _remove_filter_item(self, index: int) -> None:
+        """Remove a single filter item from the active filters display."""
+        widget = self._filter_item_widgets.pop(index)
+        widget.setParent(None)
+        widget.deleteLater()
+        if not self._filter_item_widgets:
+            self._no_filters_label.setVisible(True)
+    
+    def _create_filter_item_widget(self, filter_dict: Dict[str, Any]) -> QWidget:
         """Create a widget to display a single filter item."""
         widget = QWidget()
         layout = QHBoxLayout(widget)
@@ -492,14 +601,15 @@ class AdvancedFilterPanel(QObject):
         # Filter text
         filter_text = json.dumps(filter_dict, indent=0)
         filter_label = QLabel(filter_text)
-        filter_label.setStyleSheet(f"color: {COLORS['text_primary']}; font-family: monospace;")
+        filter_label.setStyleSheet(_FILTER_LABEL_QSS)
         layout.addWidget(filter_label)
         
-        # Remove button
+        # Remove button; the position is resolved at click time since earlier
+        # items may have been removed in the meantime
         remove_btn = QToolButton()
-        remove_btn.setIcon(fa.icon('fa6s.xmark', color=COLORS['danger']))
+        remove_btn.setIcon(_remove_icon())
         remove_btn.setToolTip("Remove filter")
-        remove_btn.clicked.connect(lambda: self._remove_filter(index))
+        remove_btn.clicked.connect(lambda: self._remove_filter(self._filter_item_widgets.index(widget)))
         layout.addWidget(remove_btn)
         
         layout.addStretch()
@@ -509,7 +619,7 @@ class AdvancedFilterPanel(QObject):
         """Remove a filter at the specified index."""
         if 0 <= index < len(self.active_filters):
             removed_filter = self.active_filters.pop(index)
-            self._update_active_filters_display()
+            self._remove_filter_item(index)
             self.logger.info(f"Removed filter: {removed_filter}")
     
     def _validate_json(self) -> None:
@@ -522,41 +632,44 @@ class AdvancedFilterPanel(QObject):
             self.syntax_highlighter.clear_error()
             return
         
+        # Cheap structural prechecks so the common "still typing" states do
+        # not pay for a full parse and exception on every keystroke
+        if text[0] != '{':
+            self.syntax_highlighter.set_error(0, "Filter must be a JSON object")
+            return
+        if text.count('{') > text.count('}') or text.count('[') > text.count(']'):
+            self.syntax_highlighter.clear_error()
+            return
+        
         try:
             json.loads(text)
             self.syntax_highlighter.clear_error()
         except json.JSONDecodeError as e:
             # Find the line with the error
-            lines = text.split('\n')
-            error_line = e.lineno - 1 if e.lineno > 0 else 0
-            error_message = str(e)
-            
-            # Use a timer to prevent recursion
-            QTimer.singleShot(0, lambda: self.syntax_highlighter.set_error(error_line, error_message))
+            error_line = max(0, (e.lineno or 1) - 1)
+            # Set synchronously like clear_error above; a deferred call could
+            # land after a later edit had already cleared the error
+            self.syntax_highlighter.set_error(error_line, str(e))
     
-    def _apply_template(self, template: str) -> None:
+    def _apply_template(self, template: str, filter_dict: Dict[str, Any]) -> None:
         """Apply a quick template filter."""
         if self.mode_tabs.currentIndex() == 1:  # Advanced mode
             if self.json_editor:
                 self.json_editor.setPlainText(template)
         else:  # Basic mode
-            # Parse template and add to basic filters
-            try:
-                filter_dict = json.loads(template)
-                for field, value in filter_dict.items():
-                    self.field_combo.setCurrentText(field)
-                    if isinstance(value, dict):
-                        # Handle complex operators
-                        operator_text = self._get_operator_for_value(value)
-                        self.operator_combo.setCurrentText(operator_text)
-                        self.value_input.setText(str(value))
-                    else:
-                        self.operator_combo.setCurrentText("equals")
-                        self.value_input.setText(str(value))
-                    
-                    self._add_basic_filter()
-            except json.JSONDecodeError:
-                QMessageBox.warning(self.widget, "Error", "Invalid template format")
+            # Add the pre-parsed template to basic filters
+            for field, value in filter_dict.items():
+                self.field_combo.setCurrentText(field)
+                if isinstance(value, dict):
+                    # Handle complex operators
+                    operator_text = self._get_operator_for_value(value)
+                    self.operator_combo.setCurrentText(operator_text)
+                    self.value_input.setText(str(value))
+                else:
+                    self.operator_combo.setCurrentText("equals")
+                    self.value_input.setText(str(value))
+                
+                self._add_basic_filter()
     
     def _get_operator_for_value(self, value: Any) -> str:
         """Get the appropriate operator for a given value."""
@@ -583,33 +696,35 @@ class AdvancedFilterPanel(QObject):
     def _apply_filter(self) -> None:
         """Apply the current filter."""
         if self.mode_tabs.currentIndex() == 0:  # Basic mode
-            # Combine all active filters
-            if self.active_filters:
-                filter_json = json.dumps(self.active_filters[0] if len(self.active_filters) == 1 else {"$and": self.active_filters})
-            else:
-                filter_json = "{}"  # Empty filter as empty JSON object
+            # Combine all active filters; they are already valid dicts
+            filter_obj = self._combined_filter()
+            filter_json = _dumps(filter_obj)
         else:  # Advanced mode
-            filter_json = self.json_editor.toPlainText().strip()
-            if not filter_json:
-                filter_json = "{}"  # Empty filter as empty JSON object
-        
-        limit = self.limit_spinbox.value() if self.limit_spinbox else 100
-        
-        # Validate JSON if not empty
-        if filter_json and filter_json != "{}":
+            filter_json = self.json_editor.toPlainText().strip() or "{}"
             try:
-                json.loads(filter_json)
+                filter_obj = json.loads(filter_json)
             except json.JSONDecodeError:
-                QMessageBox.warning(self.widget, "Validation Error", "Invalid JSON format in filter.")
+                self._show_status("Invalid JSON format in filter.")
+                return
+            if not isinstance(filter_obj, dict):
+                self._show_status("Filter must be a JSON object")
                 return
         
         # Log the filter being applied
-        if filter_json == "{}":
+        if not filter_obj:
             self.logger.info("[FILTER] Applied filter: {} (no filters)")
         else:
             self.logger.info(f"[FILTER] Applied filter: {filter_json}")
         
-        self.filter_applied.emit(filter_json, limit)
+        self.filter_applied.emit(filter_obj)
+    
+    def _combined_filter(self) -> Dict[str, Any]:
+        """Combine the basic filters into a single query."""
+        if not self.active_filters:
+            return {}
+        if len(self.active_filters) == 1:
+            return self.active_filters[0]
+        return {"$and": list(self.active_filters)}
     
     def _reset_filter(self) -> None:
         """Reset all filters to default state."""
@@ -627,24 +742,18 @@ class AdvancedFilterPanel(QObject):
         if self.value_input:
             self.value_input.clear()
         
-        # Reset limit
-        if self.limit_spinbox:
-            self.limit_spinbox.setValue(100)
-        
         self.logger.info("[FILTER] Reset to default view")
         self.filter_reset.emit()
     
     def set_available_fields(self, fields: List[str]) -> None:
         """Set the available fields for autocomplete."""
         self.available_fields = fields
-        if self.field_combo:
-            self.field_combo.clear()
-            self.field_combo.addItems(fields)
-            self._setup_autocomplete()
+        self._field_model.setStringList(fields)
     
     def set_field_values_cache(self, field_values: Dict[str, List[str]]) -> None:
         """Set cached field values for suggestions."""
         self.field_values_cache = field_values
+        self._value_completers.clear()
     
     def get_widget(self) -> QWidget | None:
         """Get the filter panel widget."""
@@ -653,16 +762,10 @@ class AdvancedFilterPanel(QObject):
     def get_current_filter(self) -> str:
         """Get the current filter JSON string."""
         if self.mode_tabs.currentIndex() == 0:  # Basic mode
-            if self.active_filters:
-                return json.dumps(self.active_filters[0] if len(self.active_filters) == 1 else {"$and": self.active_filters})
-            return ""
+            return _dumps(self._combined_filter()) if self.active_filters else ""
         else:  # Advanced mode
             return self.json_editor.toPlainText().strip() if self.json_editor else ""
     
-    def get_current_limit(self) -> int:
-        """Get the current limit value."""
-        return self.limit_spinbox.value() if self.limit_spinbox else 100
-    
     def set_filter(self, filter_json: str) -> None:
         """Set the filter JSON string."""
         if self.mode_tabs.currentIndex() == 0:  # Basic mode
@@ -677,13 +780,9 @@ class AdvancedFilterPanel(QObject):
             if self.json_editor:
                 self.json_editor.setPlainText(filter_json)
     
-    def set_limit(self, limit: int) -> None:
-        """Set the limit value."""
-        if self.limit_spinbox:
-            self.limit_spinbox.setValue(limit)
-    
     def enable_filtering(self, enabled: bool = True) -> None:
         """Enable or disable filter controls."""
+        self._filtering_enabled = enabled
         if self.field_combo:
             self.field_combo.setEnabled(enabled)
         if self.operator_combo:
@@ -5,9 +5,12 @@ Handles the MongoDB connection configuration and status display.
 
 from __future__ import annotations
 
+from functools import lru_cache
+from urllib.parse import urlsplit
+
 import qtawesome as fa
-from PySide6.QtCore import QObject, Signal
-from PySide6.QtGui import QFont
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtGui import QFont, QIcon
 from PySide6.QtWidgets import (
     QFormLayout, QGroupBox, QHBoxLayout, QLabel, QLineEdit, QPushButton,
     QSizePolicy, QVBoxLayout, QWidget
@@ -17,6 +20,12 @@ from PySide6.QtWidgets import (
 from ..styles.styles import BUTTON_STYLES, CONNECTION_PANEL_STYLE
 
 
+@lru_cache(maxsize=64)
+def _icon(name: str, color: str | None = None) -> QIcon:
+    """Return a qtawesome icon, rendering each name/color pair only once."""
+    return fa.icon(name, color=color) if color else fa.icon(name)
+
+
 class ConnectionPanel(QObject):
     """Connection panel component for MongoDB connection configuration."""
     
@@ -25,6 +34,21 @@ class ConnectionPanel(QObject):
     disconnect_requested = Signal()
     test_requested = Signal(str)  # Emits connection string for testing
     
+    # Stylesheets are set once; state changes only switch the "state" property
+    _STATUS_LABEL_QSS = """
+        QLabel { font-weight: bold; font-size: 13px; color: #dc3545; }
+        QLabel[state="connecting"] { color: #ffc107; }
+        QLabel[state="connected"] { color: #28a745; }
+    """
+    _MESSAGE_QSS = """
+        QLabel { color: #6c757d; font-size: 12px; }
+        QLabel[state="connecting"] { color: #007bff; font-weight: bold; }
+        QLabel[state="connected"] { color: #28a745; }
+        QLabel[state="failed"] { color: #dc3545; }
+        QLabel[state="test_success"] { color: #28a745; font-weight: bold; }
+        QLabel[state="test_failure"] { color: #dc3545; font-weight: bold; }
+    """
+    
     def __init__(self, parent: QObject | None = None) -> None:
         super().__init__(parent)
         self.parent = parent
@@ -37,6 +61,15 @@ class ConnectionPanel(QObject):
         self.disconnect_button: QPushButton | None = None
         self.test_button: QPushButton | None = None
         self.main_layout: QFormLayout | None = None
+        
+        # Coalesce rapid state transitions so only the last one restyles the panel
+        self._pending_state: str | None = None
+        self._last_state: str | None = None
+        self._state_timer = QTimer(self)
+        self._state_timer.setSingleShot(True)
+        self._state_timer.setInterval(30)
+        self._state_timer.timeout.connect(self._apply_pending_state)
+        
         self._create_connection_panel()
     
     def _create_connection_panel(self) -> None:
@@ -71,7 +104,8 @@ class ConnectionPanel(QObject):
         
         # Connection status label
         self.connection_status_label = QLabel("Disconnected")
-        self.connection_status_label.setStyleSheet("font-weight: bold; font-size: 13px; color: #dc3545;")
+        self.connection_status_label.setProperty("state", "disconnected")
+        self.connection_status_label.setStyleSheet(self._STATUS_LABEL_QSS)
         self.connection_status_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.connection_status_label.setMinimumHeight(24)
         
@@ -83,7 +117,8 @@ class ConnectionPanel(QObject):
         
         # Connection message
         self.connection_message = QLabel("Ready to connect")
-        self.connection_message.setStyleSheet("color: #6c757d; font-size: 12px;")
+        self.connection_message.setProperty("state", "disconnected")
+        self.connection_message.setStyleSheet(self._MESSAGE_QSS)
         self.connection_message.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.connection_message.setMinimumHeight(24)
         
@@ -99,7 +134,7 @@ class ConnectionPanel(QObject):
         button_layout.setSpacing(8)
         
         # Connect button - modern flat style with primary accent
-        self.connect_button = QPushButton(fa.icon('fa6s.play'), " Connect")
+        self.connect_button = QPushButton(" Connect")
         self.connect_button.setObjectName("connectButton")
         self.connect_button.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
         self.connect_button.setMinimumHeight(24)
@@ -108,7 +143,7 @@ class ConnectionPanel(QObject):
         self.connect_button.setStyleSheet(BUTTON_STYLES['connect_primary'])
         
         # Disconnect button - modern flat style with danger accent
-        self.disconnect_button = QPushButton(fa.icon('fa6s.stop'), " Disconnect")
+        self.disconnect_button = QPushButton(" Disconnect")
         self.disconnect_button.setObjectName("disconnectButton")
         self.disconnect_button.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
         self.disconnect_button.setMinimumHeight(24)
@@ -118,7 +153,7 @@ class ConnectionPanel(QObject):
         self.disconnect_button.setStyleSheet(BUTTON_STYLES['connect_danger'])
         
         # Test connection button - modern flat style with warning accent
-        self.test_button = QPushButton(fa.icon('fa6s.check'), " Test")
+        self.test_button = QPushButton(" Test")
         self.test_button.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
         self.test_button.setMinimumHeight(24)
         self.test_button.setMinimumWidth(60)
@@ -131,6 +166,16 @@ class ConnectionPanel(QObject):
         button_layout.addStretch()
         
         parent_layout.addRow("", button_layout)
+        
+        # Render the button icons after the first event-loop tick so they
+        # do not delay the window's first paint
+        QTimer.singleShot(0, self._install_button_icons)
+    
+    def _install_button_icons(self) -> None:
+        """Set the connect, disconnect and test button icons."""
+        self.connect_button.setIcon(_icon('fa6s.play'))
+        self.disconnect_button.setIcon(_icon('fa6s.stop'))
+        self.test_button.setIcon(_icon('fa6s.check'))
     
     def _on_connect_clicked(self) -> None:
         """Handle connect button click."""
@@ -164,12 +209,28 @@ class ConnectionPanel(QObject):
             self.connection_input.setText(connection_string)
     
     def set_connection_state(self, state: str) -> None:
-        """Set the connection state display."""
+        """Set the connection state display.
+        
+        The update is deferred briefly so that a burst of state changes
+        collapses into a single restyle of the last state.
+        """
+        if state == self._last_state and not self._state_timer.isActive():
+            return
+        self._pending_state = state
+        self._state_timer.start()
+    
+    def _apply_pending_state(self) -> None:
+        """Apply the most recently requested connection state."""
+        state = self._pending_state
+        self._pending_state = None
+        if state == self._last_state:
+            return
+        self._last_state = state
         if state == "disconnected":
             self.connection_status_label.setText("Disconnected")
-            self.connection_status_label.setStyleSheet("font-weight: bold; font-size: 13px; color: #dc3545;")
+            self._set_state_property(self.connection_status_label, "disconnected")
             self.connection_message.setText("Ready to connect")
-            self.connection_message.setStyleSheet("color: #6c757d; font-size: 12px;")
+            self._set_state_property(self.connection_message, "disconnected")
             self.loading_spinner.setVisible(False)
             self.connect_button.setEnabled(True)
             self.disconnect_button.setEnabled(False)
@@ -179,9 +240,9 @@ class ConnectionPanel(QObject):
             
         elif state == "connecting":
             self.connection_status_label.setText("Connecting...")
-            self.connection_status_label.setStyleSheet("font-weight: bold; font-size: 13px; color: #ffc107;")
+            self._set_state_property(self.connection_status_label, "connecting")
             self.connection_message.setText("Establishing connection...")
-            self.connection_message.setStyleSheet("color: #007bff; font-weight: bold;")
+            self._set_state_property(self.connection_message, "connecting")
             self.loading_spinner.setVisible(True)
             self.connect_button.setEnabled(False)
             self.disconnect_button.setEnabled(False)
@@ -189,17 +250,17 @@ class ConnectionPanel(QObject):
             
         elif state == "connected":
             self.connection_status_label.setText("Connected")
-            self.connection_status_label.setStyleSheet("font-weight: bold; font-size: 13px; color: #28a745;")
+            self._set_state_property(self.connection_status_label, "connected")
             # Extract host from connection string for cleaner display
             connection_string = self.connection_input.text().strip()
-            if "localhost" in connection_string:
+            parts = urlsplit(connection_string)
+            if parts.hostname == "localhost":
                 host_display = "localhost"
-            elif "://" in connection_string:
-                host_display = connection_string.split("://")[1].split("/")[0]
             else:
-                host_display = connection_string
+                # Drop any credentials but keep the port and replica set hosts
+                host_display = parts.netloc.rpartition("@")[2] or connection_string
             self.connection_message.setText(f"Connected to MongoDB at {host_display}")
-            self.connection_message.setStyleSheet("color: #28a745; font-size: 12px;")
+            self._set_state_property(self.connection_message, "connected")
             self.loading_spinner.setVisible(False)
             self.connect_button.setEnabled(False)
             self.disconnect_button.setEnabled(True)
@@ -209,9 +270,9 @@ class ConnectionPanel(QObject):
             
         elif state == "failed":
             self.connection_status_label.setText("Connection Failed")
-            self.connection_status_label.setStyleSheet("font-weight: bold; font-size: 13px; color: #dc3545;")
+            self._set_state_property(self.connection_status_label, "failed")
             self.connection_message.setText("Connection attempt failed")
-            self.connection_message.setStyleSheet("color: #dc3545; font-size: 12px;")
+            self._set_state_property(self.connection_message, "failed")
             self.loading_spinner.setVisible(False)
             self.connect_button.setEnabled(True)
             self.disconnect_button.setEnabled(False)
@@ -219,14 +280,30 @@ class ConnectionPanel(QObject):
             # Show the connection panel when failed
             self.show_connection_panel()
     
+    @staticmethod
+    def _set_state_property(label: QLabel, state: str) -> None:
+        """Switch a label's "state" property and repolish it if it changed."""
+        if label.property("state") == state:
+            return
+        label.setProperty("state", state)
+        style = label.style()
+        style.unpolish(label)
+        style.polish(label)
+    
     def set_test_result(self, success: bool, message: str) -> None:
         """Set the test connection result."""
+        # Apply any pending state first so it cannot overwrite the result,
+        # then forget it since the message no longer matches that state
+        if self._state_timer.isActive():
+            self._state_timer.stop()
+            self._apply_pending_state()
+        self._last_state = None
         if success:
             self.connection_message.setText("Connection test successful!")
-            self.connection_message.setStyleSheet("color: #28a745; font-weight: bold;")
+            self._set_state_property(self.connection_message, "test_success")
         else:
             self.connection_message.setText("Connection test failed!")
-            self.connection_message.setStyleSheet("color: #dc3545; font-weight: bold;")
+            self._set_state_property(self.connection_message, "test_failure")
     
     def reset_message(self) -> None:
         """Reset the connection message to default state."""
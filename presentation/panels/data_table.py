@@ -5,23 +5,478 @@ Handles the display of MongoDB documents in a table format.
 
 from __future__ import annotations
 
-from typing import Any
+import json
+import logging
+import sys
+from datetime import datetime
+from functools import lru_cache, partial
+from typing import Any, Callable
 
 import qtawesome as fa
-from PySide6.QtCore import QObject, Qt, Signal
-from PySide6.QtGui import QAction, QFont, QIcon
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QObject, QSignalBlocker, QThread, QTimer, Qt, Signal
+from PySide6.QtGui import QAction, QIcon
 from PySide6.QtWidgets import (
-    QHBoxLayout, QHeaderView, QLabel, QMenu, QProgressBar, QPushButton,
-    QSizePolicy, QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget,
+    QAbstractItemView, QHBoxLayout, QHeaderView, QLabel, QMenu, QProgressBar,
+    QPushButton, QSizePolicy, QTableView, QVBoxLayout, QWidget,
     QSpinBox, QFrame, QGridLayout, QComboBox
 )
 
 # Import styles at module level
-from ..styles.styles import BUTTON_STYLES
+from ..styles.styles import BUTTON_STYLES, CONTEXT_MENU_STYLE, DATA_TABLE_STYLE
+
+logger = logging.getLogger(__name__)
+
+# Column widths are estimated from the header and this many leading rows;
+# measuring every cell would stringify the whole result set
+COLUMN_SAMPLE_ROWS = 50
+COLUMN_PADDING = 32  # Cell/header padding plus room for the sort indicator
+MIN_COLUMN_WIDTH = 100
+DEFAULT_COLUMN_WIDTH = 180
+
+# Rows handed to the view per fetchMore() call as the user scrolls
+FETCH_BATCH_SIZE = 100
+
+# From this many documents the rows are prepared on a worker thread
+BACKGROUND_PREPARE_ROW_LIMIT = 2000
+
+# Roles and orientation compared in data()/headerData(), which Qt calls for
+# every role of every visible cell on each paint; resolving them through the
+# Qt namespace on each call costs far more than the comparison itself
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_TOOLTIP_ROLE = Qt.ItemDataRole.ToolTipRole
+_ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+_HORIZONTAL = Qt.Orientation.Horizontal
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+
+# Quiet period before a go-to-page value is acted on, so typing "123" or
+# holding an arrow loads one page instead of every value on the way
+GO_TO_PAGE_DELAY_MS = 250
+
+# Connection type for slots that redo heavy work (refetch, repopulate):
+# queued so they run after the emitting handler returns, unique so
+# repeated wiring cannot trigger the work twice
+QUEUED_UNIQUE_CONNECTION = Qt.ConnectionType(Qt.QueuedConnection.value | Qt.UniqueConnection.value)
+
+# Table stylesheet for the empty-collection placeholder, concatenated once
+_EMPTY_STATE_QSS = DATA_TABLE_STYLE + """
+QTableView::item {
+    color: #6b7280;
+    font-style: italic;
+    background-color: #f9fafb;
+}
+"""
+
+
+@lru_cache(maxsize=64)
+def _icon(name: str, color: str | None = None) -> QIcon:
+    """Return a qtawesome icon, rendering each name/color pair only once."""
+    return fa.icon(name, color=color) if color else fa.icon(name)
+
+
+def _format_str(value: str) -> str:
+    """Truncate long strings for display.
+    
+    Not cached: slicing is cheap, and a cache would keep every full string
+    it has seen alive, however long.
+    """
+    if len(value) > 50:
+        return value[:47] + "..."
+    return value
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _format_scalar(value: float | datetime) -> str:
+    """Format floats and timestamps, which repeat often within a column."""
+    return str(value)
+
+
+# Exact-type formatters for the common BSON value types; one dict lookup
+# replaces walking the isinstance chain for every cell
+_FORMATTERS = {
+    str: _format_str,
+    int: str,
+    float: _format_scalar,
+    datetime: _format_scalar,
+    bool: lambda value: "true" if value else "false",
+    dict: lambda value: f"{{ {len(value)} fields }}",
+    list: lambda value: f"[ {len(value)} items ]",
+    type(None): lambda value: "null",
+}
+
+
+# Icon name and color per exact field type; the icons themselves are
+# rendered once by _icon() on first use
+_FIELD_ICON_SPECS = {
+    str: ('fa6s.font', '#10b981'),
+    int: ('fa6s.hashtag', '#3b82f6'),
+    float: ('fa6s.hashtag', '#3b82f6'),
+    dict: ('fa6s.file-code', '#8b5cf6'),
+    list: ('fa6s.list', '#ef4444'),
+    type(None): ('fa6s.circle-xmark', '#6b7280'),
+}
+
+
+def _dumps_json(value: Any, indent: bool = False) -> str:
+    """Serialize a BSON value to JSON text, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=str, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+        except TypeError:
+            pass  # Non-string keys or out-of-range integers; json copes with both
+    if indent:
+        return json.dumps(value, indent=2, default=str)
+    return json.dumps(value, separators=(',', ':'), default=str)
+
+
+def _format_json_preview(value: dict | list) -> str:
+    """Show an embedded document or array as truncated compact JSON."""
+    text = _dumps_json(value)
+    if len(text) > 60:
+        return text[:57] + "..."
+    return text
+
+
+def _format_field_value(value: Any) -> str:
+    """Format field value for display."""
+    formatter = _FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value)
+    
+    # Subclasses (e.g. SON, custom str types) and other BSON types
+    if isinstance(value, dict):
+        return f"{{ {len(value)} fields }}"
+    elif isinstance(value, list):
+        return f"[ {len(value)} items ]"
+    elif isinstance(value, str):
+        return _format_str(value)
+    else:
+        return str(value)
+
+
+def _cell_text(value: Any, json_preview: bool) -> str:
+    """Format a cell value, showing containers as JSON when previews are on."""
+    if json_preview and isinstance(value, (dict, list)):
+        return _format_json_preview(value)
+    return _format_field_value(value)
+
+
+def _prepare_rows(documents: list[Any]) -> tuple[list[dict[str, Any]], list[str]]:
+    """Keep the dict documents and collect their field names in first-seen order."""
+    rows = [doc for doc in documents if isinstance(doc, dict)]
+    if not rows:
+        return rows, []
+    
+    # Fixed-schema collections: every document has the first one's fields,
+    # and comparing key views runs in C without building the union
+    first_keys = rows[0].keys()
+    if all(doc.keys() == first_keys for doc in rows):
+        return rows, list(map(sys.intern, first_keys))
+    
+    # Collect unique field names in a single pass; dict keys keep the
+    # order fields are first seen, which follows the documents' own order.
+    # Names are interned so repeated refreshes share one string per field
+    field_names = list(map(sys.intern, dict.fromkeys(key for doc in rows for key in doc)))
+    return rows, field_names
+
+
+def _sort_order_map(documents: list[dict[str, Any]], text_of: Callable[[dict[str, Any]], str],
+                    order: Qt.SortOrder) -> list[int]:
+    """Return document positions ordered by their displayed text."""
+    return sorted(
+        range(len(documents)),
+        key=lambda row: text_of(documents[row]),
+        reverse=order == Qt.DescendingOrder,
+    )
+
+
+class RowPreparationWorker(QThread):
+    """Worker thread that prepares table rows for large result sets.
+    
+    Besides collecting the fields, the worker orders the rows by the sort
+    column and formats the cells of the first batch, so the GUI thread
+    only has to hand the results to the model.
+    """
+    
+    # Emits generation, rows, field names, formatted texts by (id(row), field)
+    rows_prepared = Signal(int, list, list, object)
+    
+    def __init__(self, generation: int, documents: list[Any], sort_column: int = -1,
+                 sort_order: Qt.SortOrder = Qt.AscendingOrder, json_preview: bool = False) -> None:
+        super().__init__()
+        self.generation = generation
+        self.documents = documents
+        self.sort_column = sort_column
+        self.sort_order = sort_order
+        self.json_preview = json_preview
+    
+    def run(self) -> None:
+        """Prepare the rows in a separate thread."""
+        rows, field_names = _prepare_rows(self.documents)
+        json_preview = self.json_preview
+        texts: dict[tuple[int, str], str] = {}
+        
+        if 0 <= self.sort_column < len(field_names):
+            field = field_names[self.sort_column]
+            for doc in rows:
+                texts[(id(doc), field)] = _cell_text(doc.get(field, ""), json_preview)
+            order_map = _sort_order_map(rows, lambda doc: texts[(id(doc), field)], self.sort_order)
+            rows = [rows[row] for row in order_map]
+        
+        for doc in rows[:FETCH_BATCH_SIZE]:
+            for field in field_names:
+                texts[(id(doc), field)] = _cell_text(doc.get(field, ""), json_preview)
+        
+        self.rows_prepared.emit(self.generation, rows, field_names, texts)
+
+
+class DocumentsTableModel(QAbstractTableModel):
+    """Table model exposing a list of MongoDB documents, one row per document.
+    
+    Cell text is produced on demand in data(), so only the rows Qt actually
+    paints are ever formatted. Rows are exposed to the view in batches of
+    FETCH_BATCH_SIZE through canFetchMore()/fetchMore() as it scrolls.
+    """
+    
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._docs: list[dict[str, Any]] = []
+        self._fields: list[str] = []
+        self._visible = 0  # Number of documents exposed to the view so far
+        self._placeholder: str | None = None
+        # Serialized previews of embedded documents/arrays, keyed by id(value);
+        # ids stay valid because the documents are held in self._docs
+        self._json_cache: dict[int, str] = {}
+        # Formatted cell text keyed by (id(document), field), so refreshes and
+        # sorts of the same documents skip re-formatting
+        self._text_cache: dict[tuple[int, str], str] = {}
+        # Show embedded documents/arrays as JSON text instead of their size
+        self._show_json_preview = False
+    
+    def set_documents(
+        self,
+        documents: list[dict[str, Any]],
+        fields: list[str],
+        sort_column: int = -1,
+        sort_order: Qt.SortOrder = Qt.AscendingOrder,
+        texts: dict[tuple[int, str], str] | None = None,
+    ) -> None:
+        """Replace the model contents with the given documents and columns.
+        
+        When sort_column is a valid column the documents are ordered inside
+        the same reset, so the view does not need a separate re-sort.
+        texts holds cell text already formatted for these documents, keyed
+        like the model's own cache.
+        """
+        # Cached text stays valid only while it describes the same document
+        # objects; the old ones are still alive here, so equal id sets mean
+        # the same documents (e.g. switching views or re-applying a page)
+        if {id(doc) for doc in documents} != {id(doc) for doc in self._docs}:
+            self._json_cache.clear()
+            self._text_cache.clear()
+        if texts:
+            self._text_cache.update(texts)
+        if 0 <= sort_column < len(fields):
+            field = fields[sort_column]
+            order_map = _sort_order_map(documents, lambda doc: self._display_text(doc, field), sort_order)
+            documents = [documents[row] for row in order_map]
+        if self._placeholder is None and fields == self._fields:
+            # Same schema as before: keep the existing list and its strings
+            fields = self._fields
+        self.beginResetModel()
+        self._docs = documents
+        self._fields = fields
+        self._visible = min(len(documents), FETCH_BATCH_SIZE)
+        self._placeholder = None
+        self.endResetModel()
+    
+    def append_documents(self, documents: list[dict[str, Any]], new_fields: list[str]) -> None:
+        """Add documents after the current rows without resetting the model.
+        
+        new_fields are columns the added documents bring that are not shown
+        yet. The added rows are not merged into the current sort order.
+        """
+        if new_fields:
+            start = len(self._fields)
+            self.beginInsertColumns(QModelIndex(), start, start + len(new_fields) - 1)
+            self._fields = self._fields + new_fields
+            self.endInsertColumns()
+        all_visible = self._visible == len(self._docs)
+        self._docs.extend(documents)
+        if all_visible:
+            # Nothing was pending, so show the first batch of the new rows
+            # now; the rest are handed out by fetchMore() as usual
+            self.fetchMore()
+    
+    def set_placeholder(self, header: str, text: str) -> None:
+        """Show a single non-selectable placeholder cell instead of documents."""
+        self.beginResetModel()
+        self._docs = []
+        self._visible = 0
+        self._fields = [header]
+        self._placeholder = text
+        self._json_cache.clear()
+        self._text_cache.clear()
+        self.endResetModel()
+    
+    def show_json_preview(self) -> bool:
+        """Check whether embedded documents/arrays are shown as JSON."""
+        return self._show_json_preview
+    
+    def set_show_json_preview(self, enabled: bool) -> None:
+        """Switch embedded documents/arrays between JSON previews and sizes."""
+        if enabled == self._show_json_preview:
+            return
+        self._show_json_preview = enabled
+        self._text_cache.clear()
+        if self._placeholder is None and self._visible and self._fields:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(self._visible - 1, len(self._fields) - 1),
+                [Qt.DisplayRole],
+            )
+    
+    def clear(self) -> None:
+        """Remove all rows and columns."""
+        self.set_documents([], [])
+    
+    def doc_at(self, row: int) -> dict[str, Any] | None:
+        """Get the document displayed at the given row."""
+        if 0 <= row < self._visible:
+            return self._docs[row]
+        return None
+    
+    def fields(self) -> list[str]:
+        """Get the field names shown as columns."""
+        return self._fields
+    
+    def has_placeholder(self) -> bool:
+        """Check whether the placeholder cell is shown instead of documents."""
+        return self._placeholder is not None
+    
+    def remove_row(self, row: int) -> bool:
+        """Remove the document displayed at the given row."""
+        if not 0 <= row < self._visible:
+            return False
+        # The caches are keyed by id(); once the document is freed its ids
+        # can be reused by new objects, so its entries must go with it
+        doc = self._docs[row]
+        for field in self._fields:
+            self._text_cache.pop((id(doc), field), None)
+        for value in doc.values():
+            if isinstance(value, (dict, list)):
+                self._json_cache.pop(id(value), None)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._docs[row]
+        self._visible -= 1
+        self.endRemoveRows()
+        return True
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        if self._placeholder is not None:
+            return 1
+        return self._visible
+    
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid():
+            return False
+        return self._visible < len(self._docs)
+    
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        end = min(self._visible + FETCH_BATCH_SIZE, len(self._docs))
+        if end <= self._visible:
+            return
+        self.beginInsertRows(QModelIndex(), self._visible, end - 1)
+        self._visible = end
+        self.endInsertRows()
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._fields)
+    
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = _DISPLAY_ROLE) -> Any:
+        if orientation == _HORIZONTAL and role == _DISPLAY_ROLE:
+            if 0 <= section < len(self._fields):
+                return self._fields[section]
+            return None
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index: QModelIndex, role: int = _DISPLAY_ROLE) -> Any:
+        # Most calls ask for roles this model does not provide (font, colors,
+        # size hints, ...); they return before the index is looked at
+        if role == _DISPLAY_ROLE:
+            if not index.isValid():
+                return None
+            if self._placeholder is not None:
+                return self._placeholder
+            return self._display_text(self._docs[index.row()], self._fields[index.column()])
+        if role == _TOOLTIP_ROLE:
+            if not index.isValid() or self._placeholder is not None:
+                return None
+            value = self._docs[index.row()].get(self._fields[index.column()])
+            if isinstance(value, (dict, list)):
+                return self._json_preview(value)
+            return None
+        if role == _ALIGNMENT_ROLE and self._placeholder is not None:
+            return _ALIGN_CENTER
+        return None
+    
+    def _display_text(self, doc: dict[str, Any], field: str) -> str:
+        """Format a document field for display, reusing earlier results."""
+        key = (id(doc), field)
+        text = self._text_cache.get(key)
+        if text is None:
+            text = _cell_text(doc.get(field, ""), self._show_json_preview)
+            self._text_cache[key] = text
+        return text
+    
+    def _json_preview(self, value: dict | list) -> str:
+        """Serialize an embedded document or array, reusing earlier results."""
+        key = id(value)
+        text = self._json_cache.get(key)
+        if text is None:
+            text = _dumps_json(value, indent=isinstance(value, dict))
+            self._json_cache[key] = text
+        return text
+    
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if self._placeholder is not None:
+            return Qt.ItemIsEnabled
+        return super().flags(index)
+    
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+        """Sort documents by the displayed text of the given column."""
+        if self._placeholder is not None or not 0 <= column < len(self._fields):
+            return
+        self.layoutAboutToBeChanged.emit()
+        old_persistent = self.persistentIndexList()
+        old_docs = self._docs
+        field = self._fields[column]
+        order_map = _sort_order_map(old_docs, lambda doc: self._display_text(doc, field), order)
+        self._docs = [old_docs[row] for row in order_map]
+        new_row_of = {old_row: new_row for new_row, old_row in enumerate(order_map)}
+        self.changePersistentIndexList(
+            old_persistent,
+            [self.index(new_row_of[idx.row()], idx.column()) for idx in old_persistent],
+        )
+        self.layoutChanged.emit()
 
 
 class DataTable(QObject):
-    """Data table component for displaying MongoDB documents."""
+    """Data table component for displaying MongoDB documents.
+    
+    Slots for refresh_requested typically refetch and repopulate the table,
+    so they should be connected through connect_refresh(), which queues the
+    call and ignores duplicate connections.
+    """
     
     # Signals
     document_selected = Signal(dict)  # Emits selected document
@@ -40,11 +495,25 @@ class DataTable(QObject):
         super().__init__(parent)
         self.parent = parent
         self.widget: QWidget | None = None
-        self.documents_table: QTableWidget | None = None
+        self.documents_table: QTableView | None = None
+        self.documents_model: DocumentsTableModel | None = None
+        self._table_stylesheet: str | None = None
+        
+        # Background row preparation for large result sets; the generation
+        # counter lets results from superseded populate calls be dropped
+        self._populate_generation = 0
+        self._prepare_workers: set[RowPreparationWorker] = set()
+        self._preparing_rows = False
         self.collection_label: QLabel | None = None
+        self.json_preview_button: QPushButton | None = None
         self.doc_count_label: QLabel | None = None
         self.loading_indicator: QProgressBar | None = None
-        self.documents_data: list[dict[str, Any]] = []  # Store the actual document data
+        
+        # Context menu, built on the first right-click and reused afterwards
+        self._context_menu: QMenu | None = None
+        self._view_action: QAction | None = None
+        self._edit_action: QAction | None = None
+        self._delete_action: QAction | None = None
         
         # Pagination properties
         self.current_page = 1
@@ -62,6 +531,11 @@ class DataTable(QObject):
         self.last_page_btn: QPushButton | None = None
         self.go_to_page_spinbox: QSpinBox | None = None
         
+        self._go_to_page_timer = QTimer(self)
+        self._go_to_page_timer.setSingleShot(True)
+        self._go_to_page_timer.setInterval(GO_TO_PAGE_DELAY_MS)
+        self._go_to_page_timer.timeout.connect(self._on_go_to_page_timeout)
+        
         self._create_data_table()
     
     def _create_data_table(self) -> None:
@@ -97,31 +571,61 @@ class DataTable(QObject):
         
         # Refresh documents button
         refresh_docs_button = QPushButton("Refresh Documents")
-        refresh_docs_button.setIcon(fa.icon('fa6s.arrows-rotate', color='#ffffff'))  # White icon for contrast
+        refresh_docs_button.setIcon(_icon('fa6s.arrows-rotate', '#ffffff'))  # White icon for contrast
         refresh_docs_button.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
         refresh_docs_button.setMinimumHeight(28)
         refresh_docs_button.setStyleSheet(BUTTON_STYLES['refresh_primary'])  # Use primary refresh style
         refresh_docs_button.clicked.connect(self._on_refresh_clicked)
+        
+        # Fit columns button; populating only measures a sample of rows
+        fit_columns_button = QPushButton("Fit Columns")
+        fit_columns_button.setIcon(_icon('fa6s.left-right'))
+        fit_columns_button.setToolTip("Resize columns to fit their content")
+        fit_columns_button.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        fit_columns_button.setMinimumHeight(28)
+        fit_columns_button.setStyleSheet(BUTTON_STYLES['dialog_secondary'])
+        fit_columns_button.clicked.connect(self.resize_columns_to_content)
+        
+        # JSON preview toggle for embedded documents and arrays
+        self.json_preview_button = QPushButton("JSON Preview")
+        self.json_preview_button.setIcon(_icon('fa6s.code'))
+        self.json_preview_button.setToolTip("Show embedded documents and arrays as JSON")
+        self.json_preview_button.setCheckable(True)
+        self.json_preview_button.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        self.json_preview_button.setMinimumHeight(28)
+        self.json_preview_button.setStyleSheet(BUTTON_STYLES['dialog_secondary'])
+        self.json_preview_button.toggled.connect(self.set_show_json_preview)
+        
+        info_layout.addWidget(self.json_preview_button)
+        info_layout.addWidget(fit_columns_button)
         info_layout.addWidget(refresh_docs_button)
         
         parent_layout.addLayout(info_layout)
     
+    def set_show_json_preview(self, enabled: bool) -> None:
+        """Show embedded documents and arrays as JSON text instead of their size."""
+        if self.documents_model:
+            self.documents_model.set_show_json_preview(enabled)
+    
+    def connect_refresh(self, slot: Any) -> None:
+        """Connect a slot to refresh_requested as a queued, unique connection."""
+        self.refresh_requested.connect(slot, QUEUED_UNIQUE_CONNECTION)
+    
     def _on_refresh_clicked(self):
         """Handle refresh button click with logging."""
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info("[UI] Refresh button clicked")
         self.refresh_requested.emit()
     
+    def _on_page_size_text_changed(self, text: str) -> None:
+        """Handle page size selection from the combo box."""
+        self._on_page_size_changed(int(text))
+    
     def _on_page_size_changed(self, new_page_size: int) -> None:
         """Handle page size change."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         if new_page_size != self.page_size:
             self.page_size = new_page_size
             self.current_page = 1  # Reset to first page
-            logger.info(f"[PAGINATION] Page size changed to {new_page_size}")
+            logger.info("[PAGINATION] Page size changed to %s", new_page_size)
             self.page_size_changed.emit(new_page_size)
     
     def _go_to_first_page(self) -> None:
@@ -144,6 +648,10 @@ class DataTable(QObject):
         if self.current_page != self.total_pages:
             self._go_to_page(self.total_pages)
     
+    def _on_go_to_page_timeout(self) -> None:
+        """Navigate to the go-to-page value once it has settled."""
+        self._go_to_specific_page(self.go_to_page_spinbox.value())
+    
     def _go_to_specific_page(self, page_number: int) -> None:
         """Go to a specific page number."""
         if 1 <= page_number <= self.total_pages and page_number != self.current_page:
@@ -151,15 +659,12 @@ class DataTable(QObject):
     
     def _go_to_page(self, page_number: int) -> None:
         """Internal method to navigate to a specific page."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         if 1 <= page_number <= self.total_pages:
             self.current_page = page_number
-            logger.info(f"[PAGINATION] Navigating to page {page_number}")
+            logger.info("[PAGINATION] Navigating to page %s", page_number)
             self.page_changed.emit(page_number)
         else:
-            logger.warning(f"[PAGINATION] Invalid page number: {page_number}")
+            logger.warning("[PAGINATION] Invalid page number: %s", page_number)
     
     def _update_pagination_controls(self) -> None:
         """Update pagination control states and labels."""
@@ -170,10 +675,19 @@ class DataTable(QObject):
         if self.page_info_label:
             self.page_info_label.setText(f"Page {self.current_page} of {self.total_pages}")
         
-        # Update go-to-page spinbox range
+        # Update go-to-page spinbox range; a clamped value must not be
+        # mistaken for the user picking a page
         if self.go_to_page_spinbox:
-            self.go_to_page_spinbox.setRange(1, self.total_pages)
-            self.go_to_page_spinbox.setValue(self.current_page)
+            with QSignalBlocker(self.go_to_page_spinbox):
+                self.go_to_page_spinbox.setRange(1, self.total_pages)
+                self.go_to_page_spinbox.setValue(self.current_page)
+        
+        # Show the page size set by the caller without reporting it back
+        # as a user change
+        page_size_text = str(self.page_size)
+        if self.page_size_spinbox and self.page_size_spinbox.currentText() != page_size_text:
+            with QSignalBlocker(self.page_size_spinbox):
+                self.page_size_spinbox.setCurrentText(page_size_text)
         
         # Update navigation button states
         if self.first_page_btn:
@@ -229,14 +743,27 @@ class DataTable(QObject):
         parent_layout.addLayout(loading_layout)
     
     def _create_documents_table(self, parent_layout: QVBoxLayout) -> None:
-        """Create the documents table widget."""
-        self.documents_table = QTableWidget()
+        """Create the documents table view and its model."""
+        self.documents_model = DocumentsTableModel(self)
+        
+        self.documents_table = QTableView()
+        self.documents_table.setModel(self.documents_model)
         self.documents_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.documents_table.setMinimumHeight(300)
         
-        # Import and apply table styles
-        from ..styles.styles import DATA_TABLE_STYLE
-        self.documents_table.setStyleSheet(DATA_TABLE_STYLE)
+        # New columns start at the fixed default width; the last one fills
+        # whatever space is left
+        header = self.documents_table.horizontalHeader()
+        header.setDefaultSectionSize(DEFAULT_COLUMN_WIDTH)
+        header.setStretchLastSection(True)
+        
+        # Every row has the same height and cells are single-line previews,
+        # so the view never measures row contents or lays out wrapped text
+        self.documents_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.documents_table.setWordWrap(False)
+        
+        # Apply table styles
+        self._set_table_style(DATA_TABLE_STYLE)
         
         # Enable sorting
         self.documents_table.setSortingEnabled(True)
@@ -245,11 +772,12 @@ class DataTable(QObject):
         self.documents_table.setAlternatingRowColors(True)
         
         # Set selection behavior
-        self.documents_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.documents_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.documents_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.documents_table.setSelectionMode(QAbstractItemView.SingleSelection)
         
-        # Connect selection change
-        self.documents_table.itemSelectionChanged.connect(self._on_selection_changed)
+        # Selection changes are not handled yet, so selectionChanged is left
+        # unconnected; model resets in populate_documents would otherwise call
+        # into Python for every selection update
         
         # Enable context menu for right-click actions
         self.documents_table.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -257,6 +785,28 @@ class DataTable(QObject):
         
         parent_layout.addWidget(self.documents_table)
     
+    def _build_context_menu(self) -> None:
+        """Create the document context menu and its actions."""
+        self._context_menu = QMenu(self.documents_table)
+        self._context_menu.setStyleSheet(self._get_context_menu_style())
+        
+        # View Document action
+        self._view_action = QAction(_icon('fa6s.eye', '#3b82f6'), "View Document", self._context_menu)
+        self._view_action.triggered.connect(self._on_view_triggered)
+        self._context_menu.addAction(self._view_action)
+        
+        self._context_menu.addSeparator()
+        
+        # Edit Document action
+        self._edit_action = QAction(_icon('fa6s.pen', '#10b981'), "Edit Document", self._context_menu)
+        self._edit_action.triggered.connect(self._on_edit_triggered)
+        self._context_menu.addAction(self._edit_action)
+        
+        # Delete Document action
+        self._delete_action = QAction(_icon('fa6s.trash', '#ef4444'), "Delete Document", self._context_menu)
+        self._delete_action.triggered.connect(self._on_delete_triggered)
+        self._context_menu.addAction(self._delete_action)
+    
     def _create_pagination_controls(self, parent_layout: QVBoxLayout) -> None:
         """Create compact, user-friendly pagination controls."""
         # Main pagination container - no border, clean background
@@ -348,7 +898,7 @@ class DataTable(QObject):
         current_size = str(self.page_size) if str(self.page_size) in ["10", "25", "50", "100"] else "50"
         self.page_size_spinbox.setCurrentText(current_size)
         self.page_size_spinbox.setStyleSheet(BUTTON_STYLES['pagination_control'].replace('QSpinBox', 'QComboBox'))
-        self.page_size_spinbox.currentTextChanged.connect(lambda text: self._on_page_size_changed(int(text)))
+        self.page_size_spinbox.currentTextChanged.connect(self._on_page_size_text_changed)
         
         # Go to page input
         go_to_label = QLabel("Go to:")
@@ -364,7 +914,7 @@ class DataTable(QObject):
         self.go_to_page_spinbox.setRange(1, 1)
         self.go_to_page_spinbox.setValue(1)
         self.go_to_page_spinbox.setStyleSheet(BUTTON_STYLES['pagination_control'])
-        self.go_to_page_spinbox.valueChanged.connect(self._go_to_specific_page)
+        self.go_to_page_spinbox.valueChanged.connect(self._go_to_page_timer.start)
         
         # Add Enter key support for go-to page
         self.go_to_page_spinbox.installEventFilter(self)
@@ -394,7 +944,8 @@ class DataTable(QObject):
         if event.type() == event.Type.KeyPress:
             if obj == self.go_to_page_spinbox:
                 if event.key() == Qt.Key.Key_Return or event.key() == Qt.Key.Key_Enter:
-                    # Enter key pressed - navigate to the specified page
+                    # Enter key pressed - navigate to the specified page now
+                    self._go_to_page_timer.stop()
                     page_number = self.go_to_page_spinbox.value()
                     if 1 <= page_number <= self.total_pages:
                         self._go_to_page(page_number)
@@ -421,28 +972,19 @@ class DataTable(QObject):
                 return True
         return super().eventFilter(obj, event)
     
-    def _on_selection_changed(self) -> None:
-        """Handle table selection changes."""
-        current_row = self.documents_table.currentRow()
-        if current_row >= 0:
-            # Get the document data from the current row
-            # This is a simplified approach - in practice, you might want to store
-            # the full document data separately and reference it by row
-            pass
-    
     def get_widget(self) -> QWidget | None:
         """Get the data table widget."""
         return self.widget
     
-    def get_table_widget(self) -> QTableWidget | None:
-        """Get the documents table widget."""
+    def get_table_widget(self) -> QTableView | None:
+        """Get the documents table view."""
         return self.documents_table
     
     def clear_table(self) -> None:
         """Clear the documents table."""
-        if self.documents_table:
-            self.documents_table.setRowCount(0)
-            self.documents_table.setColumnCount(0)
+        if self.documents_model:
+            with QSignalBlocker(self.documents_table):
+                self.documents_model.clear()
     
     def set_collection_info(self, collection_name: str, document_count: int) -> None:
         """Set collection information in the header."""
@@ -474,147 +1016,211 @@ class DataTable(QObject):
         # Update pagination controls
         self._update_pagination_controls()
     
+    def _set_table_style(self, stylesheet: str) -> None:
+        """Apply a table stylesheet, skipping the reparse if it is already active."""
+        if self._table_stylesheet is stylesheet:
+            return
+        self._table_stylesheet = stylesheet
+        self.documents_table.setStyleSheet(stylesheet)
+    
     def populate_documents(self, documents: list[dict[str, Any]]) -> None:
         """Populate the table with documents in phpMyAdmin-style format."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         if not self.documents_table:
             logger.error("Documents table widget not initialized")
             return
         
-        logger.debug(f"Populating table with {len(documents) if documents else 0} documents")
-        
-        # Store the document data for later use
-        self.documents_data = documents if documents else []
+        logger.debug("Populating table with %d documents", len(documents) if documents else 0)
         
-        # Clear existing data
-        self.documents_table.clear()
+        # Invalidate rows still being prepared for an earlier call
+        self._populate_generation += 1
+        self._set_preparing_rows(False)
         
         if not documents:
             # Show empty state
-            self.documents_table.setRowCount(1)
-            self.documents_table.setColumnCount(1)
-            self.documents_table.setHorizontalHeaderLabels(["No documents found"])
-            
-            # Create placeholder item
-            placeholder_item = QTableWidgetItem("This collection is empty")
-            placeholder_item.setFlags(Qt.ItemIsEnabled)
-            placeholder_item.setTextAlignment(Qt.AlignCenter)
-            self.documents_table.setItem(0, 0, placeholder_item)
+            with QSignalBlocker(self.documents_table):
+                self.documents_model.set_placeholder("No documents found", "This collection is empty")
             
             # Style the placeholder
-            self.documents_table.setStyleSheet(self.documents_table.styleSheet() + """
-                QTableWidget::item {
-                    color: #6b7280;
-                    font-style: italic;
-                    background-color: #f9fafb;
-                }
-            """)
+            self._set_table_style(_EMPTY_STATE_QSS)
             logger.debug("Showing empty state for collection")
             return
         
         # Reset to default style
-        from ..styles.styles import DATA_TABLE_STYLE
-        self.documents_table.setStyleSheet(DATA_TABLE_STYLE)
-        
-        # Get all unique field names from all documents
-        all_fields = set()
-        for doc in documents:
-            if isinstance(doc, dict):
-                all_fields.update(doc.keys())
-        
-        # Sort field names for consistent column order
-        field_names = sorted(list(all_fields))
-        
-        # Set up table structure: one row per document, one column per field
-        self.documents_table.setRowCount(len(documents))
-        self.documents_table.setColumnCount(len(field_names))
-        self.documents_table.setHorizontalHeaderLabels(field_names)
-        
-        # Populate table data
-        for row, doc in enumerate(documents):
-            if not isinstance(doc, dict):
-                logger.warning(f"Skipping non-dict document at index {row}")
-                continue
+        self._set_table_style(DATA_TABLE_STYLE)
+        
+        if len(documents) >= BACKGROUND_PREPARE_ROW_LIMIT:
+            # Keep the GUI thread free while the rows are scanned, sorted
+            # and the first batch is formatted
+            table = self.documents_table
+            sort_column = table.horizontalHeader().sortIndicatorSection() if table.isSortingEnabled() else -1
+            worker = RowPreparationWorker(
+                self._populate_generation,
+                documents,
+                sort_column,
+                table.horizontalHeader().sortIndicatorOrder(),
+                self.documents_model.show_json_preview(),
+            )
+            worker.rows_prepared.connect(self._on_rows_prepared)
+            worker.finished.connect(partial(self._prepare_workers.discard, worker))
+            self._prepare_workers.add(worker)
+            self._set_preparing_rows(True, f"Preparing {len(documents)} documents...")
+            worker.start()
+            logger.debug("Preparing %d documents in the background", len(documents))
+            return
+        
+        rows, field_names = _prepare_rows(documents)
+        if len(rows) != len(documents):
+            logger.warning("Skipping %d non-dict documents", len(documents) - len(rows))
+        self._apply_prepared_rows(rows, field_names)
+    
+    def append_documents(self, documents: list[dict[str, Any]]) -> bool:
+        """Add documents below the current rows, repainting only the new range.
+        
+        Returns False when the table cannot be extended in place (it shows
+        the empty-state placeholder or rows are still being prepared); the
+        caller should then populate it with the full document list.
+        """
+        if not self.documents_table or self._preparing_rows or self.documents_model.has_placeholder():
+            return False
+        rows, field_names = _prepare_rows(documents)
+        if len(rows) != len(documents):
+            logger.warning("Skipping %d non-dict documents", len(documents) - len(rows))
+        if not rows:
+            return True
+        model = self.documents_model
+        shown = set(model.fields())
+        new_fields = [field for field in field_names if field not in shown]
+        model.append_documents(rows, new_fields)
+        logger.debug("Appended %d documents and %d columns", len(rows), len(new_fields))
+        return True
+    
+    def _on_rows_prepared(self, generation: int, rows: list[dict[str, Any]], field_names: list[str],
+                          texts: dict[tuple[int, str], str]) -> None:
+        """Apply rows prepared by a worker unless a newer populate superseded them."""
+        if generation != self._populate_generation:
+            logger.debug("Discarding rows prepared for superseded populate %d", generation)
+            return
+        worker = self.sender()
+        if worker.json_preview != self.documents_model.show_json_preview():
+            texts = {}  # The preview mode was toggled while the worker ran
+        self._apply_prepared_rows(rows, field_names, texts, (worker.sort_column, worker.sort_order))
+        self._set_preparing_rows(False)
+    
+    def _set_preparing_rows(self, preparing: bool, message: str = "") -> None:
+        """Show the loading indicator while a worker prepares rows."""
+        if preparing == self._preparing_rows:
+            return
+        # Set the flag around the call so set_loading_state applies the change
+        self._preparing_rows = False
+        self.set_loading_state(preparing, message)
+        self._preparing_rows = preparing
+    
+    def _apply_prepared_rows(
+        self,
+        rows: list[dict[str, Any]],
+        field_names: list[str],
+        texts: dict[tuple[int, str], str] | None = None,
+        sorted_by: tuple[int, Qt.SortOrder] | None = None,
+    ) -> None:
+        """Load prepared rows into the model and size the columns.
+        
+        sorted_by is the (column, order) the rows are already ordered by, if
+        any; they are only re-sorted when the view's sort indicator differs.
+        """
+        # One model reset replaces the per-cell item construction; the view
+        # keeps its current sort column, so the new rows are ordered by it
+        # inside that reset rather than re-sorted afterwards
+        table = self.documents_table
+        model = self.documents_model
+        # Column widths survive the reset, so an unchanged schema keeps the
+        # current sizing (including any the user set) instead of re-sampling
+        same_columns = not model.has_placeholder() and field_names == model.fields()
+        table.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(table)
+        try:
+            sort = (-1, Qt.AscendingOrder)
+            if table.isSortingEnabled():
+                header = table.horizontalHeader()
+                sort = (header.sortIndicatorSection(), header.sortIndicatorOrder())
+                if sort == sorted_by:
+                    sort = (-1, Qt.AscendingOrder)
+            model.set_documents(rows, field_names, *sort, texts=texts)
             
-            for col, field_name in enumerate(field_names):
-                value = doc.get(field_name, "")
-                value_text = self._format_field_value(value)
-                
-                item = QTableWidgetItem(value_text)
-                self.documents_table.setItem(row, col, item)
-        
-        # Auto-resize columns to fit content
-        self.documents_table.resizeColumnsToContents()
-        
-        # Ensure minimum column width
-        for col in range(self.documents_table.columnCount()):
-            current_width = self.documents_table.columnWidth(col)
-            if current_width < 100:
-                self.documents_table.setColumnWidth(col, 100)
-        
-        # Set header to stretch
-        header = self.documents_table.horizontalHeader()
-        header.setStretchLastSection(True)
+            if not same_columns:
+                self._fit_columns_to_sample()
+        finally:
+            blocker.unblock()
+            table.setUpdatesEnabled(True)
         
-        logger.debug(f"Table populated with {len(documents)} documents and {len(field_names)} columns")
-        logger.debug(f"Successfully populated table with {len(documents)} documents")
+        logger.debug("Table populated with %d documents and %d columns", len(rows), len(field_names))
+    
+    def _fit_columns_to_sample(self) -> None:
+        """Size columns from the header text and the first rows of the table.
+        
+        Exact fitting of every cell is left to the "Fit Columns" button.
+        """
+        table = self.documents_table
+        model = self.documents_model
+        cell_metrics = table.fontMetrics()
+        header_metrics = table.horizontalHeader().fontMetrics()
+        sample = [model.doc_at(row) for row in range(min(COLUMN_SAMPLE_ROWS, model.rowCount()))]
+        
+        # Bind the per-cell calls once; this loop runs for every sampled cell
+        advance = cell_metrics.horizontalAdvance
+        display_text = model._display_text
+        set_width = table.setColumnWidth
+        for col, field in enumerate(model.fields()):
+            width = header_metrics.horizontalAdvance(field)
+            for doc in sample:
+                text_width = advance(display_text(doc, field))
+                if text_width > width:
+                    width = text_width
+            set_width(col, max(MIN_COLUMN_WIDTH, width + COLUMN_PADDING))
     
     def _get_field_icon(self, value: Any) -> QIcon:
         """Get appropriate icon for field type."""
-        if isinstance(value, str):
-            return fa.icon('fa6s.font', color='#10b981')
-        elif isinstance(value, (int, float)):
-            return fa.icon('fa6s.hashtag', color='#3b82f6')
-        elif isinstance(value, bool):
-            return fa.icon('fa6s.toggle-on' if value else 'fa6s.toggle-off', color='#f59e0b')
-        elif isinstance(value, dict):
-            return fa.icon('fa6s.file-code', color='#8b5cf6')
-        elif isinstance(value, list):
-            return fa.icon('fa6s.list', color='#ef4444')
-        elif value is None:
-            return fa.icon('fa6s.circle-xmark', color='#6b7280')
-        else:
-            return fa.icon('fa6s.question', color='#9ca3af')
+        if type(value) is bool:
+            return _icon('fa6s.toggle-on' if value else 'fa6s.toggle-off', '#f59e0b')
+        spec = _FIELD_ICON_SPECS.get(type(value))
+        if spec is None:
+            # Subclasses such as SON fall back to their base container type
+            if isinstance(value, dict):
+                spec = _FIELD_ICON_SPECS[dict]
+            elif isinstance(value, list):
+                spec = _FIELD_ICON_SPECS[list]
+            else:
+                spec = ('fa6s.question', '#9ca3af')
+        return _icon(*spec)
     
     def _format_field_value(self, value: Any) -> str:
         """Format field value for display."""
-        if isinstance(value, dict):
-            return f"{{ {len(value)} fields }}"
-        elif isinstance(value, list):
-            return f"[ {len(value)} items ]"
-        elif isinstance(value, str):
-            if len(value) > 50:
-                return value[:47] + "..."
-            return value
-        elif value is None:
-            return "null"
-        else:
-            return str(value)
+        return _format_field_value(value)
     
     def get_document_by_row(self, row: int) -> dict[str, Any] | None:
-        """Get document data by row index."""
-        if 0 <= row < len(self.documents_data):
-            return self.documents_data[row]
-        return None
+        """Get document data by row index.
+        
+        The model keeps its documents in display order, so this stays correct
+        after the table has been sorted.
+        """
+        return self.documents_model.doc_at(row) if self.documents_model else None
     
     def get_selected_document(self) -> dict[str, Any] | None:
         """Get the currently selected document."""
-        current_row = self.documents_table.currentRow()
+        current_row = self.documents_table.currentIndex().row()
         if current_row >= 0:
             return self.get_document_by_row(current_row)
         return None
     
     def remove_selected_row(self) -> bool:
         """Remove the currently selected row from the table."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        current_row = self.documents_table.currentRow()
-        if current_row >= 0:
-            self.documents_table.removeRow(current_row)
-            logger.debug(f"Removed row {current_row} from table")
+        current_row = self.documents_table.currentIndex().row()
+        if current_row < 0:
+            logger.warning("No row selected for removal")
+            return False
+        with QSignalBlocker(self.documents_table):
+            removed = self.documents_model.remove_row(current_row)
+        if removed:
+            logger.debug("Removed row %d from table", current_row)
             return True
         else:
             logger.warning("No row selected for removal")
@@ -622,6 +1228,11 @@ class DataTable(QObject):
     
     def set_loading_state(self, loading: bool, message: str = "") -> None:
         """Set the loading state for the data table with contextual message."""
+        if not loading and self._preparing_rows:
+            # The fetch finished but the rows are still being prepared in the
+            # background; _on_rows_prepared hides the indicator once they land
+            return
+        
         if self.loading_indicator:
             self.loading_indicator.setVisible(loading)
         
@@ -670,91 +1281,85 @@ class DataTable(QObject):
     
     def _show_context_menu(self, position: Any) -> None:
         """Show context menu for document operations."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         if not self.documents_table:
             return
         
-        # Get the item at the clicked position
-        item = self.documents_table.itemAt(position)
-        if not item:
+        # Get the cell at the clicked position
+        index = self.documents_table.indexAt(position)
+        if not index.isValid():
             logger.debug("No item found at right-click position")
             return
         
         # Get the row that was right-clicked
-        clicked_row = item.row()
-        logger.debug(f"Right-clicked on row {clicked_row}")
+        clicked_row = index.row()
+        logger.debug("Right-clicked on row %d", clicked_row)
         
         # Set the clicked row as the current selection to ensure context menu actions target the correct document
-        self.documents_table.setCurrentCell(clicked_row, 0)
+        self.documents_table.setCurrentIndex(self.documents_model.index(clicked_row, 0))
         
         # Get the document data for the clicked row
         document = self.get_document_by_row(clicked_row)
         if not document:
-            logger.warning(f"No document data found for row {clicked_row}")
+            logger.warning("No document data found for row %s", clicked_row)
             return
         
         # Log which document is being targeted
-        document_id = document.get("_id", "Unknown")
-        logger.info(f"Context menu for document at row {clicked_row}, _id: {document_id}")
-        
-        # Create context menu
-        context_menu = QMenu(self.documents_table)
-        context_menu.setStyleSheet(self._get_context_menu_style())
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Context menu for document at row %s, _id: %s", clicked_row, document.get("_id", "Unknown"))
         
-        # View Document action
-        view_action = QAction(fa.icon('fa6s.eye', color='#3b82f6'), "View Document", context_menu)
-        view_action.triggered.connect(lambda: self._handle_view_document(clicked_row))
-        context_menu.addAction(view_action)
+        # Build the menu (and render its icons) only once it is first needed
+        if self._context_menu is None:
+            self._build_context_menu()
         
-        context_menu.addSeparator()
-        
-        # Edit Document action
-        edit_action = QAction(fa.icon('fa6s.pen', color='#10b981'), "Edit Document", context_menu)
-        edit_action.triggered.connect(lambda: self._handle_edit_document(clicked_row))
-        context_menu.addAction(edit_action)
-        
-        # Delete Document action
-        delete_action = QAction(fa.icon('fa6s.trash', color='#ef4444'), "Delete Document", context_menu)
-        delete_action.triggered.connect(lambda: self._handle_delete_document(clicked_row))
-        context_menu.addAction(delete_action)
+        # Point the prebuilt actions at the clicked row
+        self._view_action.setData(clicked_row)
+        self._edit_action.setData(clicked_row)
+        self._delete_action.setData(clicked_row)
         
         # Show the context menu close to the clicked item
-        if context_menu.actions():
-            global_pos = self.documents_table.mapToGlobal(position)
-            context_menu.exec_(global_pos)
+        global_pos = self.documents_table.mapToGlobal(position)
+        self._context_menu.exec_(global_pos)
     
     def _get_context_menu_style(self) -> str:
         """Get the context menu stylesheet."""
-        from ..styles.styles import CONTEXT_MENU_STYLE
         return CONTEXT_MENU_STYLE
     
+    def _on_view_triggered(self) -> None:
+        """Handle the context menu view action; the row is stored on the action."""
+        self._handle_view_document(self.sender().data())
+    
+    def _on_edit_triggered(self) -> None:
+        """Handle the context menu edit action; the row is stored on the action."""
+        self._handle_edit_document(self.sender().data())
+    
+    def _on_delete_triggered(self) -> None:
+        """Handle the context menu delete action; the row is stored on the action."""
+        self._handle_delete_document(self.sender().data())
+    
     def _handle_view_document(self, row: int) -> None:
         """Handle view document action with logging."""
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info(f"View document requested for row {row}")
-        self.view_document_requested.emit({"row": row})
+        document = self.get_document_by_row(row)
+        if document is None:
+            logger.warning("No document data found for row %s", row)
+            return
+        logger.info("View document requested for row %s", row)
+        self.view_document_requested.emit(document)
     
     def _handle_edit_document(self, row: int) -> None:
         """Handle edit document action with logging."""
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info(f"Edit document requested for row {row}")
-        self.edit_document_requested.emit({"row": row})
+        document = self.get_document_by_row(row)
+        if document is None:
+            logger.warning("No document data found for row %s", row)
+            return
+        logger.info("Edit document requested for row %s", row)
+        self.edit_document_requested.emit(document)
     
     def _handle_delete_document(self, row: int) -> None:
         """Handle delete document action with logging."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        # Get the document data for the row
         document = self.get_document_by_row(row)
-        if document:
-            document_id = document.get("_id", "Unknown")
-            logger.info(f"Delete document requested for row {row}, _id: {document_id}")
-        else:
-            logger.warning(f"No document data found for row {row}")
-        
-        self.delete_document_requested.emit({"row": row})
+        if document is None:
+            logger.warning("No document data found for row %s", row)
+            return
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Delete document requested for row %s, _id: %s", row, document.get("_id", "Unknown"))
+        self.delete_document_requested.emit(document)
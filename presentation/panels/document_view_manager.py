@@ -5,11 +5,13 @@ Manages switching between Table View and Object View for document display.
 
 from __future__ import annotations
 
+import logging
+from functools import lru_cache
 from typing import Any
 
 import qtawesome as fa
-from PySide6.QtCore import QObject, Qt, Signal
-from PySide6.QtGui import QFont
+from PySide6.QtCore import QObject, Qt, QTimer, Signal, Slot
+from PySide6.QtGui import QFont, QIcon
 from PySide6.QtWidgets import (
     QFrame, QHBoxLayout, QLabel, QPushButton, QSizePolicy, QStackedWidget,
     QVBoxLayout, QWidget
@@ -20,6 +22,89 @@ from .object_view import ObjectView
 from ..styles.styles import COLORS, BUTTON_STYLES
 from business.pagination_manager import PaginationManager
 
+logger = logging.getLogger(__name__)
+
+# View selector stylesheets; built once rather than for every manager
+_SELECTOR_FRAME_STYLE = f"""
+    QFrame {{
+        border: 1px solid {COLORS['border_light']};
+        border-radius: 6px;
+        background-color: {COLORS['bg_secondary']};
+        padding: 8px;
+    }}
+"""
+_TABLE_VIEW_BUTTON_STYLE = f"""
+    QPushButton {{
+        background-color: {COLORS['primary']};
+        color: {COLORS['text_inverse']};
+        border: 2px solid {COLORS['primary']};
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-size: 12px;
+        font-weight: 500;
+        min-height: 32px;
+        min-width: 100px;
+    }}
+    QPushButton:hover {{
+        background-color: {COLORS['primary_hover']};
+        border-color: {COLORS['primary_hover']};
+    }}
+    QPushButton:pressed {{
+        background-color: {COLORS['primary_hover']};
+        border-color: {COLORS['primary_hover']};
+    }}
+    QPushButton:checked {{
+        background-color: {COLORS['primary']};
+        color: {COLORS['text_inverse']};
+        border-color: {COLORS['primary']};
+    }}
+    QPushButton:!checked {{
+        background-color: {COLORS['bg_primary']};
+        color: {COLORS['text_secondary']};
+        border-color: {COLORS['border_light']};
+    }}
+"""
+_OBJECT_VIEW_BUTTON_STYLE = f"""
+    QPushButton {{
+        background-color: {COLORS['bg_primary']};
+        color: {COLORS['text_secondary']};
+        border: 2px solid {COLORS['border_light']};
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-size: 12px;
+        font-weight: 500;
+        min-height: 32px;
+        min-width: 100px;
+    }}
+    QPushButton:hover {{
+        background-color: {COLORS['bg_tertiary']};
+        color: {COLORS['text_primary']};
+        border-color: {COLORS['border_medium']};
+    }}
+    QPushButton:pressed {{
+        background-color: {COLORS['border_light']};
+        color: {COLORS['text_primary']};
+    }}
+    QPushButton:checked {{
+        background-color: {COLORS['primary']};
+        color: {COLORS['text_inverse']};
+        border-color: {COLORS['primary']};
+    }}
+    QPushButton:!checked {{
+        background-color: {COLORS['bg_primary']};
+        color: {COLORS['text_secondary']};
+        border-color: {COLORS['border_light']};
+    }}
+"""
+_VIEW_LABEL_STYLE = f"color: {COLORS['text_primary']};"
+_DOC_COUNT_LABEL_STYLE = f"color: {COLORS['text_secondary']}; font-size: 11px;"
+
+
+@lru_cache(maxsize=16)
+def _icon(name: str, color: str) -> QIcon:
+    """Return a qtawesome icon, rendering each name/color pair only once."""
+    return fa.icon(name, color=color)
+
 
 class DocumentViewManager(QObject):
     """Manages document views with seamless switching between table and object views."""
@@ -27,6 +112,9 @@ class DocumentViewManager(QObject):
     # Signals
     document_selected = Signal(dict)  # Emits selected document
     refresh_requested = Signal()
+    page_requested = Signal(int, int, int, object)  # Emits page number, skip, limit, last _id of previous page
+    # Same arguments plus the key the result must still match (see store_prefetched_page)
+    page_prefetch_requested = Signal(int, int, int, object, object)
     
     # Document context menu signals
     view_document_requested = Signal(dict)  # Emits selected document
@@ -54,6 +142,17 @@ class DocumentViewManager(QObject):
         self.total_documents = 0
         self.current_query = ""
         self.current_sort = None
+        self._prefetching: set[int] = set()  # Pages requested ahead of navigation
+        self._cache_generation = 0  # Bumped when cached pages are dropped
+        # Views that were hidden when current_documents last changed; they are
+        # populated when shown instead of alongside the visible view
+        self._stale_views: set[str] = set()
+        # Populating the newly shown view is deferred to the event loop, so
+        # the switch paints first and back-to-back switches populate once
+        self._sync_timer = QTimer(self)
+        self._sync_timer.setSingleShot(True)
+        self._sync_timer.setInterval(0)
+        self._sync_timer.timeout.connect(self._synchronize_views)
         
         self._create_view_manager()
     
@@ -74,9 +173,10 @@ class DocumentViewManager(QObject):
         self.data_table = DataTable(self.parent)
         self.stacked_widget.addWidget(self.data_table.get_widget())
         
-        # Create object view
-        self.object_view = ObjectView(self.parent)
-        self.stacked_widget.addWidget(self.object_view.get_widget())
+        # The object view is built the first time it is shown (see
+        # _ensure_object_view); until then a blank page holds its index
+        self._object_view_placeholder = QWidget()
+        self.stacked_widget.addWidget(self._object_view_placeholder)
         
         # Connect signals
         self._connect_signals()
@@ -90,14 +190,7 @@ class DocumentViewManager(QObject):
         """Create the view selector header."""
         selector_frame = QFrame()
         selector_frame.setFrameStyle(QFrame.StyledPanel)
-        selector_frame.setStyleSheet(f"""
-            QFrame {{
-                border: 1px solid {COLORS['border_light']};
-                border-radius: 6px;
-                background-color: {COLORS['bg_secondary']};
-                padding: 8px;
-            }}
-        """)
+        selector_frame.setStyleSheet(_SELECTOR_FRAME_STYLE)
         
         selector_layout = QHBoxLayout(selector_frame)
         selector_layout.setSpacing(12)
@@ -106,83 +199,22 @@ class DocumentViewManager(QObject):
         # View label
         view_label = QLabel("Document View:")
         view_label.setFont(QFont("Arial", 11, QFont.Bold))
-        view_label.setStyleSheet(f"color: {COLORS['text_primary']};")
+        view_label.setStyleSheet(_VIEW_LABEL_STYLE)
         
         # Table view button
         self.table_view_btn = QPushButton("Table View")
-        self.table_view_btn.setIcon(fa.icon('fa6s.table', color=COLORS['text_inverse']))
+        self.table_view_btn.setIcon(_icon('fa6s.table', COLORS['text_inverse']))
         self.table_view_btn.setCheckable(True)
         self.table_view_btn.setChecked(True)  # Default to table view
-        self.table_view_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['primary']};
-                color: {COLORS['text_inverse']};
-                border: 2px solid {COLORS['primary']};
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 12px;
-                font-weight: 500;
-                min-height: 32px;
-                min-width: 100px;
-            }}
-            QPushButton:hover {{
-                background-color: {COLORS['primary_hover']};
-                border-color: {COLORS['primary_hover']};
-            }}
-            QPushButton:pressed {{
-                background-color: {COLORS['primary_hover']};
-                border-color: {COLORS['primary_hover']};
-            }}
-            QPushButton:checked {{
-                background-color: {COLORS['primary']};
-                color: {COLORS['text_inverse']};
-                border-color: {COLORS['primary']};
-            }}
-            QPushButton:!checked {{
-                background-color: {COLORS['bg_primary']};
-                color: {COLORS['text_secondary']};
-                border-color: {COLORS['border_light']};
-            }}
-        """)
+        self.table_view_btn.setStyleSheet(_TABLE_VIEW_BUTTON_STYLE)
         self.table_view_btn.clicked.connect(self._on_table_view_clicked)
         
         # Object view button
         self.object_view_btn = QPushButton("Object View")
-        self.object_view_btn.setIcon(fa.icon('fa6s.code', color=COLORS['text_secondary']))
+        self.object_view_btn.setIcon(_icon('fa6s.code', COLORS['text_secondary']))
         self.object_view_btn.setCheckable(True)
         self.object_view_btn.setChecked(False)  # Not checked by default
-        self.object_view_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['bg_primary']};
-                color: {COLORS['text_secondary']};
-                border: 2px solid {COLORS['border_light']};
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 12px;
-                font-weight: 500;
-                min-height: 32px;
-                min-width: 100px;
-            }}
-            QPushButton:hover {{
-                background-color: {COLORS['bg_tertiary']};
-                color: {COLORS['text_primary']};
-                border-color: {COLORS['border_medium']};
-            }}
-            QPushButton:pressed {{
-                background-color: {COLORS['border_light']};
-                color: {COLORS['text_primary']};
-            }}
-            QPushButton:checked {{
-                background-color: {COLORS['primary']};
-                color: {COLORS['text_inverse']};
-                border-color: {COLORS['primary']};
-            }}
-            QPushButton:!checked {{
-                background-color: {COLORS['bg_primary']};
-                color: {COLORS['text_secondary']};
-                border-color: {COLORS['border_light']};
-            }}
-        """)
+        self.object_view_btn.setStyleSheet(_OBJECT_VIEW_BUTTON_STYLE)
         self.object_view_btn.clicked.connect(self._on_object_view_clicked)
         
         # Add widgets to layout
@@ -193,36 +225,52 @@ class DocumentViewManager(QObject):
         
         # Document count label
         self.doc_count_label = QLabel("Documents: 0")
-        self.doc_count_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 11px;")
+        self.doc_count_label.setStyleSheet(_DOC_COUNT_LABEL_STYLE)
         selector_layout.addWidget(self.doc_count_label)
         
         parent_layout.addWidget(selector_frame)
     
     def _connect_signals(self) -> None:
-        """Connect signals from both views."""
-        # Data table signals
-        self.data_table.document_selected.connect(self.document_selected.emit)
-        self.data_table.refresh_requested.connect(self.refresh_requested.emit)
-        self.data_table.view_document_requested.connect(self.view_document_requested.emit)
-        self.data_table.edit_document_requested.connect(self.edit_document_requested.emit)
-        self.data_table.delete_document_requested.connect(self.delete_document_requested.emit)
+        """Connect the data table signals; _ensure_object_view connects the object view."""
+        # Data table signals; document actions already carry the document,
+        # so they are forwarded signal-to-signal without a Python relay
+        self.data_table.document_selected.connect(self.document_selected)
+        self.data_table.connect_refresh(self.refresh_requested)
+        self.data_table.view_document_requested.connect(self.view_document_requested)
+        self.data_table.edit_document_requested.connect(self.edit_document_requested)
+        self.data_table.delete_document_requested.connect(self.delete_document_requested)
         
         # Pagination signals
         self.data_table.page_changed.connect(self._on_page_changed)
         self.data_table.page_size_changed.connect(self._on_page_size_changed)
+    
+    def _ensure_object_view(self) -> ObjectView:
+        """Create the object view on first use and put it in place of its placeholder."""
+        if self.object_view is not None:
+            return self.object_view
+        
+        logger.debug("Creating object view")
+        self.object_view = ObjectView(self.parent)
+        self.stacked_widget.removeWidget(self._object_view_placeholder)
+        self._object_view_placeholder.deleteLater()
+        self._object_view_placeholder = None
+        self.stacked_widget.insertWidget(1, self.object_view.get_widget())
         
         # Object view signals
-        self.object_view.document_selected.connect(self.document_selected.emit)
-        self.object_view.refresh_requested.connect(self.refresh_requested.emit)
-        self.object_view.view_document_requested.connect(self.view_document_requested.emit)
-        self.object_view.edit_document_requested.connect(self.edit_document_requested.emit)
-        self.object_view.delete_document_requested.connect(self.delete_document_requested.emit)
+        self.object_view.document_selected.connect(self.document_selected)
+        self.object_view.refresh_requested.connect(self.refresh_requested)
+        self.object_view.view_document_requested.connect(self.view_document_requested)
+        self.object_view.edit_document_requested.connect(self.edit_document_requested)
+        self.object_view.delete_document_requested.connect(self.delete_document_requested)
+        
+        # Bring it up to date with what the table was given meanwhile
+        self.object_view.set_collection_info(self.current_collection_name, self.total_documents)
+        self._stale_views.add("object")
+        return self.object_view
     
+    @Slot()
     def _on_table_view_clicked(self) -> None:
         """Handle table view button click."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         # Always activate table view when clicked
         if self.current_view != "table":
             logger.info("Table View activated")
@@ -232,11 +280,9 @@ class DocumentViewManager(QObject):
             logger.info("Table View clicked (already active)")
             self._ensure_correct_button_states()
     
+    @Slot()
     def _on_object_view_clicked(self) -> None:
         """Handle object view button click."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         # Always activate object view when clicked
         if self.current_view != "object":
             logger.info("Object View activated")
@@ -248,14 +294,11 @@ class DocumentViewManager(QObject):
     
     def _switch_view(self, view_type: str) -> None:
         """Switch between table and object views."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         if view_type == self.current_view:
-            logger.debug(f"Already in {view_type} view, no switch needed")
+            logger.debug("Already in %s view, no switch needed", view_type)
             return
         
-        logger.info(f"Switching from {self.current_view} view to {view_type} view")
+        logger.info("Switching from %s view to %s view", self.current_view, view_type)
         
         # Update current view
         self.current_view = view_type
@@ -267,22 +310,20 @@ class DocumentViewManager(QObject):
             self.stacked_widget.setCurrentIndex(0)
             logger.info("Table View activated - showing table content")
         else:
+            self._ensure_object_view()
             self.table_view_btn.setChecked(False)
             self.object_view_btn.setChecked(True)
             self.stacked_widget.setCurrentIndex(1)
             logger.info("Object View activated - showing JSON content")
         
-        # Synchronize data between views
-        self._synchronize_views()
+        # Synchronize data between views once pending events are handled
+        self._sync_timer.start()
         
         # Ensure button states are correct
         self._ensure_correct_button_states()
     
     def _ensure_correct_button_states(self) -> None:
         """Ensure only one button is checked at a time."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         # Block signals temporarily to prevent recursive calls
         self.table_view_btn.blockSignals(True)
         self.object_view_btn.blockSignals(True)
@@ -308,23 +349,38 @@ class DocumentViewManager(QObject):
         """Update button icon colors based on their checked state."""
         # Update table view button icon
         if self.table_view_btn.isChecked():
-            self.table_view_btn.setIcon(fa.icon('fa6s.table', color=COLORS['text_inverse']))
+            self.table_view_btn.setIcon(_icon('fa6s.table', COLORS['text_inverse']))
         else:
-            self.table_view_btn.setIcon(fa.icon('fa6s.table', color=COLORS['text_secondary']))
+            self.table_view_btn.setIcon(_icon('fa6s.table', COLORS['text_secondary']))
         
         # Update object view button icon
         if self.object_view_btn.isChecked():
-            self.object_view_btn.setIcon(fa.icon('fa6s.code', color=COLORS['text_inverse']))
+            self.object_view_btn.setIcon(_icon('fa6s.code', COLORS['text_inverse']))
         else:
-            self.object_view_btn.setIcon(fa.icon('fa6s.code', color=COLORS['text_secondary']))
+            self.object_view_btn.setIcon(_icon('fa6s.code', COLORS['text_secondary']))
     
+    @Slot()
     def _synchronize_views(self) -> None:
-        """Synchronize data between table and object views."""
-        if self.current_documents:
-            if self.current_view == "table":
-                self.data_table.populate_documents(self.current_documents)
-            else:
-                self.object_view.populate_documents(self.current_documents)
+        """Populate the now-visible view if documents changed while it was hidden."""
+        if self.current_view not in self._stale_views:
+            return
+        self._stale_views.discard(self.current_view)
+        if self.current_view == "table":
+            self.data_table.populate_documents(self.current_documents)
+            page_info = self.pagination_manager.get_page_info(self.current_page, self.total_documents, self.current_page_size)
+            self.data_table.set_pagination_info(page_info.page_number, page_info.total_pages, page_info.limit)
+        else:
+            self.object_view.populate_documents(self.current_documents)
+    
+    def _flush_view_sync(self) -> None:
+        """Run a pending view synchronization now, before reading from the view."""
+        if self._sync_timer.isActive():
+            self._sync_timer.stop()
+            self._synchronize_views()
+    
+    def _mark_hidden_view_stale(self) -> None:
+        """Record that the hidden view no longer shows current_documents."""
+        self._stale_views = {"object" if self.current_view == "table" else "table"}
     
     def get_widget(self) -> QWidget | None:
         """Get the view manager widget."""
@@ -336,36 +392,30 @@ class DocumentViewManager(QObject):
     
     def force_view(self, view_type: str) -> None:
         """Force a specific view to be active (for debugging and consistency)."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         if view_type not in ["table", "object"]:
-            logger.warning(f"Invalid view type: {view_type}. Must be 'table' or 'object'")
+            logger.warning("Invalid view type: %s. Must be 'table' or 'object'", view_type)
             return
         
-        logger.info(f"Force activating {view_type} view")
+        logger.info("Force activating %s view", view_type)
         self._switch_view(view_type)
     
+    @Slot(int)
     def _on_page_changed(self, page_number: int) -> None:
         """Handle page change from data table."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         if page_number != self.current_page:
-            logger.info(f"[PAGINATION] Page changed to {page_number}")
+            logger.info("[PAGINATION] Page changed to %s", page_number)
             self.current_page = page_number
             self._load_current_page()
     
+    @Slot(int)
     def _on_page_size_changed(self, page_size: int) -> None:
         """Handle page size change from data table."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         if page_size != self.current_page_size:
-            logger.info(f"[PAGINATION] Page size changed to {page_size}")
+            logger.info("[PAGINATION] Page size changed to %s", page_size)
             self.current_page_size = page_size
             self.current_page = 1  # Reset to first page
-            self.pagination_manager.clear_cache_for_query(self.current_query, self.current_sort)
+            # Cached pages were cut at the old size
+            self.clear_page_cache()
             self._load_current_page()
     
     def get_view_status(self) -> dict:
@@ -388,8 +438,8 @@ class DocumentViewManager(QObject):
         return self.data_table
     
     def get_object_view(self) -> ObjectView | None:
-        """Get the object view component."""
-        return self.object_view
+        """Get the object view component, creating it if it has not been shown yet."""
+        return self._ensure_object_view()
     
     def get_pagination_stats(self) -> dict:
         """Get pagination and cache statistics."""
@@ -407,9 +457,6 @@ class DocumentViewManager(QObject):
     
     def _load_current_page(self) -> None:
         """Load the current page of documents."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         if not self.current_collection_name:
             logger.warning("[PAGINATION] No collection selected, cannot load page")
             return
@@ -417,32 +464,30 @@ class DocumentViewManager(QObject):
         # Check if page is cached
         cached_documents = self.pagination_manager.get_cached_page(self.current_page)
         if cached_documents:
-            logger.info(f"[PAGINATION] Using cached page {self.current_page}")
+            logger.info("[PAGINATION] Using cached page %s", self.current_page)
             self._populate_current_view(cached_documents)
+            QTimer.singleShot(0, self._prefetch_next_page)
             return
         
         # Page not cached, need to load from database
-        logger.info(f"[PAGINATION] Loading page {self.current_page} from database")
+        logger.info("[PAGINATION] Loading page %s from database", self.current_page)
         self._request_page_from_database()
     
     def _request_page_from_database(self) -> None:
         """Request a page of documents from the database."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        # This method will be called by the main window when it has access to mongo_service
-        # For now, we'll emit a signal to request the page
-        logger.info(f"[PAGINATION] Requesting page {self.current_page} (size: {self.current_page_size})")
-        # TODO: Implement database request logic in main window
-    
-    def _populate_current_view(self, documents: List[Dict[str, Any]]) -> None:
+        # The main window owns the database service; it answers with load_page().
+        # When the previous page is known the fetch can start after its last
+        # _id, which the _id index answers without scanning the skipped pages
+        logger.info("[PAGINATION] Requesting page %s (size: %s)", self.current_page, self.current_page_size)
+        skip = (self.current_page - 1) * self.current_page_size
+        after_id = self.pagination_manager.get_page_cursor(self.current_page)
+        self.page_requested.emit(self.current_page, skip, self.current_page_size, after_id)
+    
+    def _populate_current_view(self, documents: list[dict[str, Any]]) -> None:
         """Populate the current view with documents."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         self.current_documents = documents
         
-        logger.debug(f"Populating {self.current_view} view with {len(documents)} documents")
+        logger.debug("Populating %s view with %s documents", self.current_view, len(documents))
         
         if self.current_view == "table":
             self.data_table.populate_documents(documents)
@@ -451,6 +496,7 @@ class DocumentViewManager(QObject):
             self.data_table.set_pagination_info(page_info.page_number, page_info.total_pages, page_info.limit)
         else:
             self.object_view.populate_documents(documents)
+        self._mark_hidden_view_stale()
     
     def set_collection_info(self, collection_name: str, document_count: int) -> None:
         """Set collection information in both views."""
@@ -458,7 +504,8 @@ class DocumentViewManager(QObject):
         
         # Update both views
         self.data_table.set_collection_info(collection_name, document_count)
-        self.object_view.set_collection_info(collection_name, document_count)
+        if self.object_view is not None:
+            self.object_view.set_collection_info(collection_name, document_count)
         
         # Update document count in selector
         self.doc_count_label.setText(f"Documents: {document_count}")
@@ -467,24 +514,52 @@ class DocumentViewManager(QObject):
         self.total_documents = document_count
         self.current_page = 1  # Reset to first page when collection changes
         
-        # Clear cache for new collection
-        self.pagination_manager.clear_cache()
+        # Clear cache for new collection; the caller loads the first page
+        self.clear_page_cache()
+        self.pagination_manager.set_id_bracket(None)
+    
+    def set_id_bracket(self, bracket: str | None) -> None:
+        """Record the type bracket every _id of the current results is in, if any.
+        
+        Page cursors are only used within that bracket; see
+        PaginationManager.get_page_cursor().
+        """
+        self.pagination_manager.set_id_bracket(bracket)
+    
+    def set_document_count(self, document_count: int) -> None:
+        """Update the number of documents without leaving the current page."""
+        self.total_documents = document_count
+        self.doc_count_label.setText(f"Documents: {document_count}")
+        self.data_table.set_collection_info(self.current_collection_name, document_count)
+        if self.object_view is not None:
+            self.object_view.set_collection_info(self.current_collection_name, document_count)
+        
+        # Stay on the current page unless it no longer exists
+        page_info = self.pagination_manager.get_page_info(self.current_page, document_count, self.current_page_size)
+        self.current_page = min(self.current_page, page_info.total_pages)
+    
+    def set_query(self, query: str, sort: list[tuple[str, int]] | None = None) -> None:
+        """Set the query the cached pages belong to.
         
-        # Load first page
-        self._load_current_page()
+        Pages stay cached while the query is unchanged, so paging back and
+        forth through the same results skips the database; a different
+        query or sort drops them.
+        """
+        self.pagination_manager.clear_cache_for_query(query, sort)
+        self.current_query = query
+        self.current_sort = sort
     
     def populate_documents(self, documents: list[dict[str, Any]], page_number: int = 1) -> None:
         """Populate documents in the current view with pagination support."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         self.current_documents = documents if documents else []
         
-        logger.debug(f"Populating {self.current_view} view with {len(self.current_documents)} documents (page {page_number})")
+        logger.debug("Populating %s view with %s documents (page %s)", self.current_view, len(self.current_documents), page_number)
         
         # Cache the page if it's not already cached
         if documents and page_number > 0:
             self.pagination_manager.cache_page(page_number, documents)
+            # Fetch the following page once this one has been painted
+            QTimer.singleShot(0, self._prefetch_next_page)
         
         if self.current_view == "table":
             self.data_table.populate_documents(documents)
@@ -493,22 +568,69 @@ class DocumentViewManager(QObject):
             self.data_table.set_pagination_info(page_info.page_number, page_info.total_pages, page_info.limit)
         else:
             self.object_view.populate_documents(documents)
+        self._mark_hidden_view_stale()
+    
+    def append_documents(self, documents: list[dict[str, Any]]) -> None:
+        """Add a batch of documents to the current view without rebuilding its rows."""
+        if not documents:
+            return
+        # A new list, so pages cached from the old one are left untouched
+        self.current_documents = self.current_documents + documents
+        
+        if self.current_view == "table":
+            if not self.data_table.append_documents(documents):
+                self.data_table.populate_documents(self.current_documents)
+        else:
+            self.object_view.populate_documents(self.current_documents)
+        self._mark_hidden_view_stale()
+    
+    def clear_page_cache(self) -> None:
+        """Drop cached pages and page cursors, e.g. after the documents changed.
+        
+        Prefetches still in flight were read before the change; bumping the
+        generation makes store_prefetched_page discard them.
+        """
+        self.pagination_manager.clear_cache()
+        self._prefetching.clear()
+        self._cache_generation += 1
+    
+    def prefetch_key(self) -> tuple[str, str, int, int]:
+        """Identify the result set that cached pages belong to."""
+        return (self.current_collection_name, self.current_query, self.current_page_size, self._cache_generation)
+    
+    @Slot()
+    def _prefetch_next_page(self) -> None:
+        """Ask for the page after the current one so "next" is served from cache."""
+        next_page = self.current_page + 1
+        page_info = self.pagination_manager.get_page_info(self.current_page, self.total_documents, self.current_page_size)
+        if (next_page > page_info.total_pages or next_page in self._prefetching
+                or self.pagination_manager.is_page_cached(next_page)):
+            return
+        self._prefetching.add(next_page)
+        skip = (next_page - 1) * self.current_page_size
+        after_id = self.pagination_manager.get_page_cursor(next_page)
+        self.page_prefetch_requested.emit(next_page, skip, self.current_page_size, after_id, self.prefetch_key())
+    
+    def store_prefetched_page(self, page_number: int, documents: list[dict[str, Any]], key: Any) -> None:
+        """Cache a page fetched ahead of navigation, unless the results changed since."""
+        self._prefetching.discard(page_number)
+        if not documents or key != self.prefetch_key() or self.pagination_manager.is_page_cached(page_number):
+            return
+        self.pagination_manager.cache_page(page_number, documents)
     
     def load_page(self, page_number: int, documents: list[dict[str, Any]]) -> None:
         """Load a specific page of documents."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         if page_number != self.current_page:
-            logger.info(f"[PAGINATION] Loading page {page_number} with {len(documents)} documents")
+            logger.info("[PAGINATION] Loading page %s with %s documents", page_number, len(documents))
             self.current_page = page_number
             self.populate_documents(documents, page_number)
         else:
-            logger.debug(f"[PAGINATION] Page {page_number} already loaded")
+            logger.debug("[PAGINATION] Page %s already loaded", page_number)
             self.populate_documents(documents, page_number)
     
     def get_selected_document(self) -> dict[str, Any] | None:
         """Get the currently selected document from the active view."""
+        self._flush_view_sync()
         if self.current_view == "table":
             return self.data_table.get_selected_document()
         else:
@@ -517,18 +639,22 @@ class DocumentViewManager(QObject):
     def clear_views(self) -> None:
         """Clear both views."""
         self.current_documents = []
+        self._stale_views.clear()
         self.data_table.clear_table()
-        self.object_view.clear_tree()
+        if self.object_view is not None:
+            self.object_view.clear_tree()
     
     def set_loading_state(self, loading: bool) -> None:
         """Set the loading state for both views."""
         self.data_table.set_loading_state(loading)
-        self.object_view.set_loading_state(loading)
+        if self.object_view is not None:
+            self.object_view.set_loading_state(loading)
     
     def set_error_state(self, error_message: str) -> None:
         """Set the error state for both views."""
         self.data_table.set_error_state(error_message)
-        self.object_view.set_error_state(error_message)
+        if self.object_view is not None:
+            self.object_view.set_error_state(error_message)
     
     def refresh_current_view(self) -> None:
         """Refresh the current view."""
@@ -539,6 +665,7 @@ class DocumentViewManager(QObject):
     
     def get_document_by_index(self, index: int) -> dict[str, Any] | None:
         """Get document by index from the current view."""
+        self._flush_view_sync()
         if self.current_view == "table":
             return self.data_table.get_document_by_row(index)
         else:
@@ -546,6 +673,7 @@ class DocumentViewManager(QObject):
     
     def get_document_by_row(self, row: int) -> dict[str, Any] | None:
         """Get document by row (for table view compatibility)."""
+        self._flush_view_sync()
         if self.current_view == "table":
             return self.data_table.get_document_by_row(row)
         else:
@@ -553,18 +681,19 @@ class DocumentViewManager(QObject):
     
     def remove_selected_row(self) -> bool:
         """Remove the selected row from the current view."""
+        self._flush_view_sync()
         if self.current_view == "table":
             return self.data_table.remove_selected_row()
         else:
             # For object view, we need to handle this differently
-            # since it doesn't have rows in the same way
-            selected_doc = self.object_view.get_selected_document()
-            if selected_doc:
-                # Remove from documents list
-                if selected_doc in self.current_documents:
-                    self.current_documents.remove(selected_doc)
-                    self.object_view.populate_documents(self.current_documents)
-                    return True
+            # since it doesn't have rows in the same way; its document
+            # positions match current_documents, so remove by index
+            index = self.object_view.get_selected_index()
+            if index is not None and 0 <= index < len(self.current_documents):
+                del self.current_documents[index]
+                self.object_view.populate_documents(self.current_documents)
+                self._mark_hidden_view_stale()
+                return True
             return False
     
     def resize_columns_to_content(self) -> None:
@@ -6,13 +6,15 @@ Handles the display of MongoDB documents with always-visible, editable JSON cont
 from __future__ import annotations
 
 import json
+import logging
 from datetime import date, datetime
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 import qtawesome as fa
 from PySide6.QtCore import QObject, Qt, Signal, QTimer
-from PySide6.QtGui import QAction, QColor, QFont, QTextCharFormat, QTextCursor, QSyntaxHighlighter
+from PySide6.QtGui import QAction, QColor, QFont, QIcon, QTextCharFormat, QTextCursor, QSyntaxHighlighter
 from PySide6.QtWidgets import (
     QFrame, QHBoxLayout, QLabel, QMenu, QPushButton, QScrollArea, QSizePolicy,
     QTextEdit, QVBoxLayout, QWidget, QToolTip
@@ -21,6 +23,14 @@ from PySide6.QtWidgets import (
 # Import styles at module level
 from ..styles.styles import BUTTON_STYLES
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=64)
+def _icon(name: str, color: str | None = None) -> QIcon:
+    """Return a qtawesome icon, rendering each name/color pair only once."""
+    return fa.icon(name, color=color) if color else fa.icon(name)
+
 
 class MongoDBJSONEncoder(json.JSONEncoder):
     """Custom JSON encoder for MongoDB documents with ObjectId and other special types."""
@@ -49,9 +59,7 @@ def safe_json_dumps(obj: Any, **kwargs: Any) -> str:
     try:
         return json.dumps(obj, cls=MongoDBJSONEncoder, **kwargs)
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.warning(f"JSON serialization failed, using fallback: {e}")
+        logger.warning("JSON serialization failed, using fallback: %s", e)
         # Fallback: convert to string representation
         return str(obj)
 
@@ -130,9 +138,7 @@ class JSONEditor(QTextEdit):
         
         # Log the validation error (only once per error state)
         if not hasattr(self, '_last_error_message') or self._last_error_message != self.error_message:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"JSON validation error: {self.error_message}")
+            logger.warning("JSON validation error: %s", self.error_message)
             self._last_error_message = self.error_message
     
     def _clear_error(self) -> None:
@@ -147,8 +153,6 @@ class JSONEditor(QTextEdit):
             
             # Log successful validation (only when transitioning from error to valid)
             if hasattr(self, '_last_error_message') and self._last_error_message:
-                import logging
-                logger = logging.getLogger(__name__)
                 logger.info("JSON validation passed")
                 self._last_error_message = ""
     
@@ -315,6 +319,7 @@ class DocumentWidget(QFrame):
         self.save_button: QPushButton | None = None
         self.cancel_button: QPushButton | None = None
         self.action_buttons_layout: QHBoxLayout | None = None
+        self._context_menu: QMenu | None = None  # Built on the first right-click
         self._create_widget()
     
     def _create_widget(self) -> None:
@@ -385,7 +390,7 @@ class DocumentWidget(QFrame):
         
         # Cancel button (red full background)
         self.cancel_button = QPushButton("Cancel")
-        self.cancel_button.setIcon(fa.icon('fa6s.xmark', color='#ffffff'))
+        self.cancel_button.setIcon(_icon('fa6s.xmark', '#ffffff'))
         self.cancel_button.setStyleSheet("""
             QPushButton {
                 background-color: #ef4444;
@@ -406,7 +411,7 @@ class DocumentWidget(QFrame):
         
         # Save button (green border style)
         self.save_button = QPushButton("Save")
-        self.save_button.setIcon(fa.icon('fa6s.check', color='#10b981'))
+        self.save_button.setIcon(_icon('fa6s.check', '#10b981'))
         self.save_button.setStyleSheet("""
             QPushButton {
                 background-color: transparent;
@@ -454,23 +459,18 @@ class DocumentWidget(QFrame):
             self._update_action_buttons_visibility()
             
         except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.error(f"Error formatting JSON for document {self.index}: {e}")
+            logger.error("Error formatting JSON for document %s: %s", self.index, e)
             self.json_editor.setPlainText(str(self.document))
             self.original_json = str(self.document)
     
     def _on_json_text_changed(self) -> None:
         """Handle JSON text changes."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         # Check if content has changed from original
         current_text = self.json_editor.toPlainText()
         self.is_modified = (current_text != self.original_json)
         
         if self.is_modified:
-            logger.info(f"User started editing document {self.index}")
+            logger.info("User started editing document %d", self.index)
             self.json_edited.emit(self.index)
         
         self._update_action_buttons_visibility()
@@ -493,12 +493,9 @@ class DocumentWidget(QFrame):
     
     def _save_editing(self) -> None:
         """Save the edited JSON content."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         # Check if JSON is valid before saving
         if not self.json_editor.is_valid:
-            logger.warning(f"User attempted to save invalid JSON for document {self.index}")
+            logger.warning("User attempted to save invalid JSON for document %s", self.index)
             return
         
         try:
@@ -521,19 +518,16 @@ class DocumentWidget(QFrame):
             toast_manager = ToastManager()
             toast_manager.show_success("Document saved successfully.", self.parent())
             
-            logger.info(f"User saved document {self.index}")
+            logger.info("User saved document %s", self.index)
             
         except Exception as e:
             # Show general error
             from PySide6.QtWidgets import QMessageBox
             QMessageBox.critical(self, "Error", f"Error saving document: {str(e)}")
-            logger.error(f"Error saving document {self.index}: {str(e)}")
+            logger.error("Error saving document %s: %s", self.index, e)
     
     def _cancel_editing(self) -> None:
         """Cancel editing and restore original JSON."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         # Restore original JSON
         self.json_editor.setPlainText(self.original_json)
         self.is_modified = False
@@ -542,7 +536,7 @@ class DocumentWidget(QFrame):
         # Emit cancel signal
         self.json_cancelled.emit(self.index)
         
-        logger.info(f"User cancelled editing document {self.index}")
+        logger.info("User cancelled editing document %s", self.index)
         
         # Note: No toast notification on cancel as per requirements
     
@@ -558,71 +552,65 @@ class DocumentWidget(QFrame):
         except json.JSONDecodeError:
             pass
         except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Error parsing edited JSON: {e}")
+            logger.warning("Error parsing edited JSON: %s", e)
         return None
     
     def _show_context_menu(self, position: Any) -> None:
         """Show context menu for document operations."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         # Log which document is being targeted
-        document_id = self.document.get("_id", "Unknown")
-        logger.info(f"Context menu for document at index {self.index}, _id: {document_id}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Context menu for document at index %s, _id: %s", self.index, self.document.get("_id", "Unknown"))
+        
+        # The menu only acts on this widget's document, so it is built once
+        # and shown again on later right-clicks
+        if self._context_menu is None:
+            self._context_menu = self._build_context_menu()
         
-        # Create context menu
+        # Show the context menu at the cursor position
+        global_pos = self.mapToGlobal(position)
+        self._context_menu.exec_(global_pos)
+    
+    def _build_context_menu(self) -> QMenu:
+        """Create the context menu for document operations."""
         context_menu = QMenu(self)
         
         # View Document action
-        view_action = QAction(fa.icon('fa6s.eye', color='#3b82f6'), "View Document", context_menu)
-        view_action.triggered.connect(lambda: self._handle_view_document())
+        view_action = QAction(_icon('fa6s.eye', '#3b82f6'), "View Document", context_menu)
+        view_action.triggered.connect(self._handle_view_document)
         context_menu.addAction(view_action)
         
         context_menu.addSeparator()
         
         # Edit Document action
-        edit_action = QAction(fa.icon('fa6s.pen', color='#10b981'), "Edit Document", context_menu)
-        edit_action.triggered.connect(lambda: self._handle_edit_document())
+        edit_action = QAction(_icon('fa6s.pen', '#10b981'), "Edit Document", context_menu)
+        edit_action.triggered.connect(self._handle_edit_document)
         context_menu.addAction(edit_action)
         
         # Delete Document action
-        delete_action = QAction(fa.icon('fa6s.trash', color='#ef4444'), "Delete Document", context_menu)
-        delete_action.triggered.connect(lambda: self._handle_delete_document())
+        delete_action = QAction(_icon('fa6s.trash', '#ef4444'), "Delete Document", context_menu)
+        delete_action.triggered.connect(self._handle_delete_document)
         context_menu.addAction(delete_action)
         
-        # Show the context menu at the cursor position
-        if context_menu.actions():
-            global_pos = self.mapToGlobal(position)
-            context_menu.exec_(global_pos)
+        return context_menu
     
     def _handle_view_document(self) -> None:
         """Handle view document action."""
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info(f"View document requested for document at index {self.index}")
+        logger.info("View document requested for document at index %s", self.index)
         self.document_selected.emit(self.index)
     
     def _handle_edit_document(self) -> None:
         """Handle edit document action."""
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info(f"Edit document requested for document at index {self.index}")
+        logger.info("Edit document requested for document at index %s", self.index)
         # Enable editing mode
         self._enable_editing()
     
     def _handle_delete_document(self) -> None:
         """Handle delete document action."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        # Get the document data for the index
-        document_id = self.document.get("_id", "Unknown")
-        logger.info(f"Delete document requested for document at index {self.index}, _id: {document_id}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Delete document requested for document at index %s, _id: %s", self.index, self.document.get("_id", "Unknown"))
         
-        # Emit delete signal
-        self.delete_document_requested.emit({"index": self.index})
+        # Emit delete signal with the document itself
+        self.delete_document_requested.emit(self.document)
     
     def _enable_editing(self) -> None:
         """Enable editing mode for the document."""
@@ -651,6 +639,8 @@ class ObjectView(QObject):
         self.doc_count_label: QLabel | None = None
         self.documents_data: List[Dict[str, Any]] = []  # Store the actual document data
         self.document_widgets: List[DocumentWidget] = []
+        # Position of the document last viewed or asked to be deleted
+        self._selected_index: Optional[int] = None
         self.scroll_area: QScrollArea | None = None
         self.scroll_content: QWidget | None = None
         self.loading_indicator: QLabel | None = None
@@ -705,8 +695,6 @@ class ObjectView(QObject):
     
     def _on_refresh_clicked(self):
         """Handle refresh button click with logging."""
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info("[UI] Refresh button clicked")
         self.refresh_requested.emit()
     
@@ -741,6 +729,7 @@ class ObjectView(QObject):
         """Handle document selection."""
         # Emit document selected signal
         if 0 <= index < len(self.documents_data):
+            self._selected_index = index
             self.document_selected.emit(self.documents_data[index])
     
     def _on_json_edited(self, index: int) -> None:
@@ -760,9 +749,11 @@ class ObjectView(QObject):
     
     def _on_delete_document_requested(self, document: Dict[str, Any]) -> None:
         """Handle delete document request."""
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info(f"User requested to delete document: {document}")
+        logger.info("User requested to delete document: %s", document)
+        # The document is removed from the view by position once deleted
+        widget = self.sender()
+        if isinstance(widget, DocumentWidget):
+            self._selected_index = widget.index
         self.delete_document_requested.emit(document)
     
     def get_widget(self) -> QWidget | None:
@@ -773,6 +764,7 @@ class ObjectView(QObject):
         """Clear the documents list."""
         self._clear_document_widgets()
         self.documents_data = []
+        self._selected_index = None
     
     def _clear_document_widgets(self) -> None:
         """Clear all document widgets."""
@@ -797,17 +789,15 @@ class ObjectView(QObject):
     
     def populate_documents(self, documents: List[Dict[str, Any]]) -> None:
         """Populate the documents area with document widgets."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         if not self.scroll_layout:
             logger.error("Scroll layout not initialized")
             return
         
-        logger.debug(f"Populating documents area with {len(documents) if documents else 0} documents")
+        logger.debug("Populating documents area with %s documents", len(documents) if documents else 0)
         
         # Store the document data for later use
         self.documents_data = documents if documents else []
+        self._selected_index = None
         
         # Clear existing widgets
         self._clear_document_widgets()
@@ -831,7 +821,7 @@ class ObjectView(QObject):
         # Create document widgets (lazy loading will be handled by scroll area)
         for index, doc in enumerate(documents):
             if not isinstance(doc, dict):
-                logger.warning(f"Skipping non-dict document at index {index}")
+                logger.warning("Skipping non-dict document at index %s", index)
                 continue
             
             # Create document widget
@@ -846,7 +836,7 @@ class ObjectView(QObject):
             self.scroll_layout.insertWidget(self.scroll_layout.count() - 1, doc_widget)
             self.document_widgets.append(doc_widget)
         
-        logger.debug(f"Successfully populated documents area with {len(documents)} documents")
+        logger.debug("Successfully populated documents area with %s documents", len(documents))
     
     def get_document_by_index(self, index: int) -> Optional[Dict[str, Any]]:
         """Get document data by index."""
@@ -856,9 +846,13 @@ class ObjectView(QObject):
     
     def get_selected_document(self) -> Optional[Dict[str, Any]]:
         """Get the currently selected document."""
-        # Since we removed the selection mechanism, return None for now
-        # This can be enhanced if needed for specific use cases
-        return None
+        if self._selected_index is None:
+            return None
+        return self.get_document_by_index(self._selected_index)
+    
+    def get_selected_index(self) -> Optional[int]:
+        """Get the position of the currently selected document in the shown list."""
+        return self._selected_index
     
     def get_edited_json(self) -> Optional[Dict[str, Any]]:
         """Get the edited JSON from the first document widget (for compatibility)."""
@@ -5,6 +5,8 @@ Handles the left panel with databases and collections tree view.
 
 from __future__ import annotations
 
+import logging
+from functools import partial
 from typing import Any
 
 import qtawesome as fa
@@ -18,6 +20,8 @@ from PySide6.QtWidgets import (
 # Import styles at module level
 from ..styles.styles import BUTTON_STYLES, LABEL_STYLES, SIDEBAR_TREE_STYLE, CONTEXT_MENU_STYLE
 
+logger = logging.getLogger(__name__)
+
 
 class Sidebar(QObject):
     """Sidebar component for displaying databases and collections."""
@@ -107,8 +111,6 @@ class Sidebar(QObject):
     
     def _on_refresh_clicked(self):
         """Handle refresh button click with logging."""
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info("[UI] Refresh button clicked")
         self.refresh_requested.emit()
     
@@ -152,9 +154,6 @@ class Sidebar(QObject):
     
     def _show_context_menu(self, position: Any) -> None:
         """Show context menu for database operations."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         if not self.db_tree:
             return
         
@@ -165,6 +164,7 @@ class Sidebar(QObject):
         
         # Create context menu
         context_menu = QMenu(self.db_tree)
+        context_menu.setAttribute(Qt.WA_DeleteOnClose)
         context_menu.setStyleSheet(self._get_context_menu_style())
         
         # Get item data
@@ -181,19 +181,19 @@ class Sidebar(QObject):
             
             # Add Collection action
             add_collection_action = QAction(fa.icon('fa6s.plus', color='#10b981'), "Add Collection", context_menu)
-            add_collection_action.triggered.connect(lambda: self._handle_add_collection(database_name))
+            add_collection_action.triggered.connect(partial(self._handle_add_collection, database_name))
             context_menu.addAction(add_collection_action)
             
             context_menu.addSeparator()
             
             # Rename Database action
             rename_action = QAction(fa.icon('fa6s.pen', color='#3b82f6'), "Rename Database", context_menu)
-            rename_action.triggered.connect(lambda: self._handle_rename_database(database_name))
+            rename_action.triggered.connect(partial(self._handle_rename_database, database_name))
             context_menu.addAction(rename_action)
             
             # Delete Database action
             delete_action = QAction(fa.icon('fa6s.trash', color='#ef4444'), "Delete Database", context_menu)
-            delete_action.triggered.connect(lambda: self._handle_delete_database(database_name))
+            delete_action.triggered.connect(partial(self._handle_delete_database, database_name))
             context_menu.addAction(delete_action)
             
         elif item_type == "collection":
@@ -203,19 +203,19 @@ class Sidebar(QObject):
             
             # Insert Document action
             insert_action = QAction(fa.icon('fa6s.plus', color='#10b981'), "Insert Document", context_menu)
-            insert_action.triggered.connect(lambda: self._handle_insert_document(database_name, collection_name))
+            insert_action.triggered.connect(partial(self._handle_insert_document, database_name, collection_name))
             context_menu.addAction(insert_action)
             
             context_menu.addSeparator()
             
             # Rename Collection action
             rename_action = QAction(fa.icon('fa6s.pen', color='#3b82f6'), "Rename Collection", context_menu)
-            rename_action.triggered.connect(lambda: self._handle_rename_collection(database_name, collection_name))
+            rename_action.triggered.connect(partial(self._handle_rename_collection, database_name, collection_name))
             context_menu.addAction(rename_action)
             
             # Delete Collection action
             delete_action = QAction(fa.icon('fa6s.trash', color='#ef4444'), "Delete Collection", context_menu)
-            delete_action.triggered.connect(lambda: self._handle_delete_collection(database_name, collection_name))
+            delete_action.triggered.connect(partial(self._handle_delete_collection, database_name, collection_name))
             context_menu.addAction(delete_action)
         
         # Show the context menu close to the item
@@ -226,43 +226,31 @@ class Sidebar(QObject):
     
     def _handle_add_collection(self, database_name: str) -> None:
         """Handle add collection action with logging."""
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info(f"Add collection requested for database: {database_name}")
         self.add_collection_requested.emit(database_name)
     
     def _handle_rename_database(self, database_name: str) -> None:
         """Handle rename database action with logging."""
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info(f"Rename database requested: {database_name}")
         self.rename_database_requested.emit(database_name)
     
     def _handle_delete_database(self, database_name: str) -> None:
         """Handle delete database action with logging."""
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info(f"Delete database requested: {database_name}")
         self.delete_database_requested.emit(database_name)
     
     def _handle_insert_document(self, database_name: str, collection_name: str) -> None:
         """Handle insert document action with logging."""
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info(f"Insert document requested for {database_name}/{collection_name}")
         self.insert_document_requested.emit(database_name, collection_name)
     
     def _handle_rename_collection(self, database_name: str, collection_name: str) -> None:
         """Handle rename collection action with logging."""
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info(f"Rename collection requested: {database_name}/{collection_name}")
         self.rename_collection_requested.emit(database_name, collection_name)
     
     def _handle_delete_collection(self, database_name: str, collection_name: str) -> None:
         """Handle delete collection action with logging."""
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info(f"Delete collection requested: {database_name}/{collection_name}")
         self.delete_collection_requested.emit(database_name, collection_name)
     
@@ -301,9 +289,6 @@ class Sidebar(QObject):
         if not self.db_tree:
             return
         
-        import logging
-        logger = logging.getLogger(__name__)
-        
         # Clean the database name (remove leading/trailing spaces)
         clean_db_name = database_name.strip()
         
@@ -342,9 +327,6 @@ class Sidebar(QObject):
         if not self.db_tree:
             return False
         
-        import logging
-        logger = logging.getLogger(__name__)
-        
         # Clean the database name (remove leading/trailing spaces)
         clean_db_name = database_name.strip()
         
@@ -407,8 +389,6 @@ class Sidebar(QObject):
             
             return False
         except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.error(f"Error checking if database {database_name} exists: {e}")
             return False
     
@@ -435,8 +415,6 @@ class Sidebar(QObject):
             
             return False
         except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.error(f"Error selecting database {database_name}: {e}")
             return False
     
@@ -498,7 +476,5 @@ class Sidebar(QObject):
             
             return False
         except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.error(f"Error selecting collection {database_name}/{collection_name}: {e}")
             return False
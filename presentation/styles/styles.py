@@ -104,7 +104,7 @@ QTreeWidget::branch:open:has-children:has-siblings {{
 
 # Data Table styles
 DATA_TABLE_STYLE = f"""
-QTableWidget {{
+QTableView {{
     border: 1px solid {COLORS['border_light']};
     border-radius: 8px;
     background-color: {COLORS['bg_primary']};
@@ -116,24 +116,24 @@ QTableWidget {{
     outline: none;
 }}
 
-QTableWidget::item {{
+QTableView::item {{
     padding: 12px 8px;
     border-radius: 4px;
     border: none;
 }}
 
-QTableWidget::item:selected {{
+QTableView::item:selected {{
     background-color: {COLORS['primary_light']};
     color: {COLORS['text_primary']};
     font-weight: 500;
 }}
 
-QTableWidget::item:hover {{
+QTableView::item:hover {{
     background-color: {COLORS['bg_tertiary']};
     color: {COLORS['text_primary']};
 }}
 
-QTableWidget::item:selected:hover {{
+QTableView::item:selected:hover {{
     background-color: {COLORS['primary']};
     color: {COLORS['text_inverse']};
 }}
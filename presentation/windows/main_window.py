@@ -6,7 +6,9 @@ Integrates all modular UI components.
 
 import sys
 import json
-from typing import List, Dict, Any
+import logging
+from functools import partial
+from typing import List, Dict, Any, Optional
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QSplitter, QTabWidget,
     QApplication, QSizePolicy, QDialog, QMessageBox
@@ -38,6 +40,13 @@ from ..dialogs.message_box_helper import MessageBoxHelper
 # Import business layer
 from business.mongo_service import MongoService
 from business.schema_analyzer import SchemaAnalyzer
+from business.pagination_manager import id_sort_bracket
+
+logger = logging.getLogger(__name__)
+
+# Paged document views are ordered by _id so a page can be fetched as a
+# range after the previous page's last _id instead of with skip()
+PAGE_SORT = [("_id", 1)]
 
 
 class ConnectionWorker(QThread):
@@ -56,6 +65,51 @@ class ConnectionWorker(QThread):
         self.connection_result.emit(success, message)
 
 
+class PagePrefetchWorker(QThread):
+    """Worker thread that fetches a page of documents ahead of navigation."""
+    
+    page_fetched = Signal(int, list, object)  # Emits page number, documents, prefetch key
+    
+    def __init__(self, service: MongoService, database_name: str, collection_name: str,
+                 page_number: int, query: Optional[Dict[str, Any]], limit: int, skip: int,
+                 sort: List[Any], key: Any):
+        super().__init__()
+        self.service = service
+        self.database_name = database_name
+        self.collection_name = collection_name
+        self.page_number = page_number
+        self.query = query
+        self.limit = limit
+        self.skip = skip
+        self.sort = sort
+        self.key = key
+    
+    def run(self):
+        """Fetch the page in a separate thread."""
+        documents = self.service.find_documents(
+            self.database_name, self.collection_name, self.query, self.limit, self.skip, self.sort
+        )
+        self.page_fetched.emit(self.page_number, documents, self.key)
+
+
+class ExactCountWorker(QThread):
+    """Worker thread that counts every document of an unfiltered collection."""
+    
+    count_ready = Signal(int, object)  # Emits document count, prefetch key
+    
+    def __init__(self, service: MongoService, database_name: str, collection_name: str, key: Any):
+        super().__init__()
+        self.service = service
+        self.database_name = database_name
+        self.collection_name = collection_name
+        self.key = key
+    
+    def run(self):
+        """Count the documents in a separate thread."""
+        count = self.service.count_documents(self.database_name, self.collection_name, exact=True)
+        self.count_ready.emit(count, self.key)
+
+
 class MainWindow(QMainWindow):
     """Main application window for AtlasMogo."""
     
@@ -64,6 +118,9 @@ class MainWindow(QMainWindow):
         self.mongo_service = MongoService()
         self.current_database = ""
         self.current_collection = ""
+        self.current_filter: Optional[Dict[str, Any]] = None  # Active advanced filter, if any
+        self._prefetch_workers = set()
+        self._count_workers = set()
         self.connection_state = "disconnected"
         
         # Initialize UI components
@@ -121,12 +178,9 @@ class MainWindow(QMainWindow):
     
     def _set_window_icon(self):
         """Set the application window icon."""
-        import logging
         import os
         from pathlib import Path
         
-        logger = logging.getLogger(__name__)
-        
         # Try multiple paths for the icon file
         icon_paths = [
             "resources/icons/icon.ico",  # Relative to current directory
@@ -218,7 +272,8 @@ class MainWindow(QMainWindow):
     def setup_connections(self):
         """Setup signal connections between components."""
         # Connection panel signals
-        self.connection_panel.connect_requested.connect(self.connect_to_mongodb)
+        # Connecting and refreshing do heavy rework, so let the emitting handler return first
+        self.connection_panel.connect_requested.connect(self.connect_to_mongodb, Qt.QueuedConnection)
         self.connection_panel.disconnect_requested.connect(self.disconnect_from_mongodb)
         self.connection_panel.test_requested.connect(self.test_connection)
         
@@ -237,7 +292,9 @@ class MainWindow(QMainWindow):
         self.sidebar.insert_document_requested.connect(self.on_insert_document_from_context)
         
         # Document view manager signals
-        self.document_view_manager.refresh_requested.connect(self.refresh_documents)
+        self.document_view_manager.refresh_requested.connect(self.refresh_documents, Qt.QueuedConnection)
+        self.document_view_manager.page_requested.connect(self.load_documents_page)
+        self.document_view_manager.page_prefetch_requested.connect(self.prefetch_documents_page)
         self.document_view_manager.view_document_requested.connect(self.on_view_document)
         self.document_view_manager.edit_document_requested.connect(self.on_edit_document)
         self.document_view_manager.delete_document_requested.connect(self.on_delete_document_from_context)
@@ -440,9 +497,6 @@ class MainWindow(QMainWindow):
             MessageBoxHelper.warning(self, "Not Connected", "Please connect to MongoDB first.")
             return
         
-        import logging
-        logger = logging.getLogger(__name__)
-        
         # Show loading state
         self.sidebar.set_loading_state(True)
         
@@ -496,9 +550,6 @@ class MainWindow(QMainWindow):
     
     def auto_select_new_database(self, database_name: str):
         """Auto-select a newly created database in the sidebar."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         try:
             # Find the database item in the sidebar
             success = self.sidebar.select_database(database_name)
@@ -516,9 +567,6 @@ class MainWindow(QMainWindow):
     
     def select_collection_in_sidebar(self, database_name: str, collection_name: str):
         """Select a specific collection in the sidebar after refresh."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         try:
             # Find and select the collection in the sidebar
             success = self.sidebar.select_collection(database_name, collection_name)
@@ -535,9 +583,6 @@ class MainWindow(QMainWindow):
     
     def on_database_selected(self, database_name: str):
         """Handle database selection."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         self.current_database = database_name
         self.current_collection = ""
         
@@ -566,25 +611,19 @@ class MainWindow(QMainWindow):
     
     def on_collection_selected(self, database_name: str, collection_name: str):
         """Handle collection selection."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         self.current_database = database_name
         self.current_collection = collection_name
         
         logger.info(f"Collection selected: {database_name}/{collection_name}")
         
         # Update labels
-        self.document_view_manager.set_collection_info(collection_name, 0)
         self.sidebar.update_selected_database(f"{database_name} > {collection_name}")
         
-        # Get document count and load documents
+        # Start the views on the new collection's first page; refresh_documents
+        # counts the documents and loads that page. Page navigation reuses the
+        # count instead of counting again
         try:
-            count = self.mongo_service.count_documents(database_name, collection_name)
-            logger.debug(f"Collection {collection_name} has {count} documents")
-            self.document_view_manager.set_collection_info(collection_name, count)
-            
-            # Load documents
+            self.document_view_manager.set_collection_info(collection_name, 0)
             self.refresh_documents()
             
         except Exception as e:
@@ -597,9 +636,6 @@ class MainWindow(QMainWindow):
     
     def refresh_documents(self):
         """Refresh the documents table."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         if not self.current_database or not self.current_collection:
             logger.warning("No database or collection selected for document refresh")
             return
@@ -607,21 +643,45 @@ class MainWindow(QMainWindow):
         logger.info(f"Refreshing documents for {self.current_database}/{self.current_collection}")
         
         self.document_view_manager.set_loading_state(True)
+        self.current_filter = None
+        self.document_view_manager.set_query("")
+        # Documents may have been inserted, edited or deleted since the
+        # pages were cached, so every page is read again
+        self.document_view_manager.clear_page_cache()
         
         try:
+            # Recount as well: a filter may have replaced the total with its
+            # match count, and the collection may have grown or shrunk
+            count = self.mongo_service.count_documents(self.current_database, self.current_collection)
+            logger.debug(f"Collection {self.current_collection} has {count} documents")
+            self.document_view_manager.set_document_count(count)
+            
+            # Fetch only the page the views are on, never the whole collection
+            page = self.document_view_manager.current_page
+            page_size = self.document_view_manager.current_page_size
+            self.document_view_manager.set_id_bracket(
+                self._detect_id_bracket(None) if count > page_size else None
+            )
             documents = self.mongo_service.find_documents(
                 self.current_database, 
                 self.current_collection, 
-                limit=50
+                limit=page_size,
+                skip=(page - 1) * page_size,
+                sort=PAGE_SORT
             )
             
             logger.debug(f"Retrieved {len(documents) if documents else 0} documents")
-            self.document_view_manager.populate_documents(documents)
+            self.document_view_manager.populate_documents(documents, page)
             
             # Update status bar
             doc_count = len(documents) if documents else 0
             self.status_bar_component.show_message(f"Loaded {doc_count} documents", 2000)
             
+            # The count above is estimated from collection metadata, which can
+            # drift after unclean shutdowns or on sharded collections; correct
+            # the total once the page is showing
+            self._start_exact_count()
+            
         except Exception as e:
             logger.error(f"Failed to load documents: {e}")
             self.document_view_manager.set_error_state(str(e))
@@ -630,11 +690,120 @@ class MainWindow(QMainWindow):
         finally:
             self.document_view_manager.set_loading_state(False)
     
+    def load_documents_page(self, page_number: int, skip: int, limit: int, after_id: Any = None):
+        """Fetch one page of documents requested by the pagination controls.
+        
+        The fetch itself is planned by _plan_page_query().
+        """
+        if not self.current_database or not self.current_collection:
+            return
+        
+        query, skip = self._plan_page_query(skip, after_id)
+        logger.info(f"[PAGINATION] Fetching page {page_number} (skip={skip}, limit={limit}, "
+                    f"after_id={after_id})")
+        self.document_view_manager.set_loading_state(True)
+        try:
+            documents = self.mongo_service.find_documents(
+                self.current_database,
+                self.current_collection,
+                query,
+                limit,
+                skip,
+                PAGE_SORT
+            )
+            self.document_view_manager.load_page(page_number, documents)
+        except Exception as e:
+            logger.error(f"Failed to load page {page_number}: {e}")
+            self.document_view_manager.set_error_state(str(e))
+        finally:
+            self.document_view_manager.set_loading_state(False)
+    
+    def _detect_id_bracket(self, query: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Find the type bracket every _id of the results is in, or None if mixed.
+        
+        MongoDB sorts _ids bracket by bracket, so when the smallest and the
+        largest _id share a bracket, every _id between them does as well.
+        """
+        first = self.mongo_service.find_documents(
+            self.current_database, self.current_collection, query, 1, sort=PAGE_SORT
+        )
+        last = self.mongo_service.find_documents(
+            self.current_database, self.current_collection, query, 1,
+            sort=[(field, -direction) for field, direction in PAGE_SORT]
+        )
+        if not first or not last:
+            return None
+        bracket = id_sort_bracket(first[0].get("_id"))
+        return bracket if id_sort_bracket(last[0].get("_id")) == bracket else None
+    
+    def _plan_page_query(self, skip: int, after_id: Any):
+        """Build the query and skip for one page of the current results.
+        
+        When after_id (the previous page's last _id) is known, the page is
+        fetched as an _id range instead of skipping the earlier documents.
+        The view manager only hands out after_id while every _id of the
+        results is in its type bracket (see _detect_id_bracket), because
+        the range would silently leave out _ids of other types.
+        """
+        query = self.current_filter
+        if after_id is not None:
+            id_range = {"_id": {"$gt": after_id}}
+            query = {"$and": [query, id_range]} if query else id_range
+            skip = 0
+        return query, skip
+    
+    def prefetch_documents_page(self, page_number: int, skip: int, limit: int, after_id: Any, key: Any):
+        """Fetch a page in the background so navigating to it is served from cache."""
+        if not self.current_database or not self.current_collection:
+            self.document_view_manager.store_prefetched_page(page_number, [], key)
+            return
+        
+        query, skip = self._plan_page_query(skip, after_id)
+        worker = PagePrefetchWorker(
+            self.mongo_service, self.current_database, self.current_collection,
+            page_number, query, limit, skip, PAGE_SORT, key
+        )
+        worker.page_fetched.connect(self._on_page_prefetched)
+        worker.finished.connect(partial(self._prefetch_workers.discard, worker))
+        self._prefetch_workers.add(worker)
+        worker.start()
+    
+    def _start_exact_count(self):
+        """Count the current collection exactly in the background."""
+        worker = ExactCountWorker(
+            self.mongo_service, self.current_database, self.current_collection,
+            self.document_view_manager.prefetch_key()
+        )
+        worker.count_ready.connect(self._on_exact_count)
+        worker.finished.connect(partial(self._count_workers.discard, worker))
+        self._count_workers.add(worker)
+        worker.start()
+    
+    def _on_exact_count(self, count: int, key: Any):
+        """Replace the estimated total if the same unfiltered results are shown."""
+        worker = self.sender()
+        if (worker.database_name != self.current_database
+                or worker.collection_name != self.current_collection
+                or key != self.document_view_manager.prefetch_key()):
+            # A filter, another collection or a refresh took over meanwhile
+            return
+        if count != self.document_view_manager.total_documents:
+            logger.debug(f"Exact count of {self.current_collection}: {count} documents")
+            self.document_view_manager.set_document_count(count)
+    
+    def _on_page_prefetched(self, page_number: int, documents: List[Dict[str, Any]], key: Any):
+        """Hand a prefetched page to the view manager if the results are unchanged."""
+        worker = self.sender()
+        if (worker.database_name != self.current_database
+                or worker.collection_name != self.current_collection
+                or key != self.document_view_manager.prefetch_key()):
+            # Another database, collection, filter or page size was selected,
+            # or the pages were dropped, while fetching
+            documents = []
+        self.document_view_manager.store_prefetched_page(page_number, documents, key)
+    
     def insert_document(self, document_text: str):
         """Insert a new document."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         if not self.current_database or not self.current_collection:
             MessageBoxHelper.warning(self, "Warning", "Please select a collection first.")
             return
@@ -681,9 +850,6 @@ class MainWindow(QMainWindow):
     
     def delete_document(self, filter_text: str):
         """Delete a document."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         if not self.current_database or not self.current_collection:
             MessageBoxHelper.warning(self, "Warning", "Please select a collection first.")
             return
@@ -735,55 +901,58 @@ class MainWindow(QMainWindow):
         else:
             self.query_panel.set_query_results("No documents found.")
     
-    def execute_advanced_filter(self, filter_json: str, limit: int):
+    def execute_advanced_filter(self, filter_query: Dict[str, Any]):
         """Execute an advanced filter and update the data table."""
         if not self.current_database or not self.current_collection:
             MessageBoxHelper.warning(self, "Warning", "Please select a collection first.")
             return
         
-        import logging
-        logger = logging.getLogger(__name__)
-        
         # Handle empty or default filters
-        if not filter_json or filter_json.strip() == "" or filter_json == "{}":
-            logger.info("Executing advanced filter: {} (no filters) with limit {}", filter_json, limit)
+        if not filter_query:
+            logger.info("Executing advanced filter: {} (no filters)")
             # Show all documents when no filter is applied
             self.refresh_documents()
             return
         
-        logger.info(f"Executing advanced filter: {filter_json} with limit {limit}")
+        logger.info("Executing advanced filter: %s", filter_query)
         
         try:
-            # Execute the filter
+            # The matches are paged like the whole collection: the total is
+            # the filter's match count, and only the first page is fetched
+            total = self.mongo_service.count_documents(
+                self.current_database,
+                self.current_collection,
+                filter_query
+            )
+            
+            # The panel has already parsed the filter
+            page_size = self.document_view_manager.current_page_size
+            id_bracket = self._detect_id_bracket(filter_query) if total > page_size else None
             documents = self.mongo_service.find_documents(
                 self.current_database,
                 self.current_collection,
-                filter_json,
-                limit
+                filter_query,
+                page_size,
+                skip=0,
+                sort=PAGE_SORT
             )
             
-            if documents:
-                # Update the data table with filtered results
-                self.document_view_manager.populate_documents(documents)
-                
-                # Update collection info
-                self.document_view_manager.set_collection_info(
-                    self.current_collection, 
-                    len(documents)
-                )
-                
+            # Only a filter that ran becomes the one pages are fetched with
+            self.current_filter = filter_query
+            self.document_view_manager.set_query(json.dumps(filter_query, sort_keys=True, default=str))
+            self.document_view_manager.set_collection_info(self.current_collection, total)
+            self.document_view_manager.set_id_bracket(id_bracket)
+            self.document_view_manager.populate_documents(documents, 1)
+            
+            if total:
                 # Show success message
                 self.status_bar_component.show_message(
-                    f"Filter applied: {len(documents)} documents found", 
+                    f"Filter applied: {total} documents found", 
                     3000
                 )
                 
-                logger.info(f"Advanced filter executed successfully: {len(documents)} documents found")
+                logger.info(f"Advanced filter executed successfully: {total} documents found")
             else:
-                # Show no results
-                self.document_view_manager.populate_documents([])
-                self.document_view_manager.set_collection_info(self.current_collection, 0)
-                
                 self.status_bar_component.show_message(
                     "Filter applied: No documents found", 
                     3000
@@ -800,8 +969,6 @@ class MainWindow(QMainWindow):
         if not self.current_database or not self.current_collection:
             return
         
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info("Resetting advanced filter")
         
         # Reload all documents
@@ -814,8 +981,6 @@ class MainWindow(QMainWindow):
         """Initialize the schema analyzer service."""
         if self.mongo_service:
             self.schema_analyzer = SchemaAnalyzer(self.mongo_service)
-            import logging
-            logger = logging.getLogger(__name__)
             logger.info("Schema analyzer initialized")
     
     def _update_filter_panel_schema(self, database_name: str, collection_name: str):
@@ -824,8 +989,6 @@ class MainWindow(QMainWindow):
             return
         
         try:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.info(f"Updating filter panel schema for {database_name}.{collection_name}")
             
             # Get field names for autocomplete
@@ -848,9 +1011,6 @@ class MainWindow(QMainWindow):
     
     def _on_collection_selected(self, database_name: str, collection_name: str):
         """Handle collection selection and update related components."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         self.current_database = database_name
         self.current_collection = collection_name
         
@@ -1007,9 +1167,6 @@ class MainWindow(QMainWindow):
     # Placeholder methods for menu actions
     def on_new_connection(self):
         """Handle new connection menu action."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         logger.info("Opening new connection dialog")
         
         # Show connection dialog
@@ -1043,9 +1200,6 @@ class MainWindow(QMainWindow):
     
     def on_open_connection(self):
         """Handle open connection menu action."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         logger.info("Opening connection dialog")
         
         # Get current connection string if connected
@@ -1150,9 +1304,6 @@ class MainWindow(QMainWindow):
             MessageBoxHelper.warning(self, "Warning", "Please connect to MongoDB first.")
             return
         
-        import logging
-        logger = logging.getLogger(__name__)
-        
         # Show create database dialog (same as sidebar)
         dialog = CreateDatabaseDialog(self)
         if dialog.exec() == QDialog.Accepted:
@@ -1277,9 +1428,6 @@ class MainWindow(QMainWindow):
             MessageBoxHelper.warning(self, "Warning", "Please connect to MongoDB first.")
             return
         
-        import logging
-        logger = logging.getLogger(__name__)
-        
         # Show create database dialog
         dialog = CreateDatabaseDialog(self)
         if dialog.exec() == QDialog.Accepted:
@@ -1401,8 +1549,6 @@ class MainWindow(QMainWindow):
             MessageBoxHelper.warning(self, "Warning", "Please select a database first.")
             return
         
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info(f"Opening export schema dialog for database: {self.current_database}")
         
         # Import and show export schema dialog
@@ -1454,9 +1600,6 @@ class MainWindow(QMainWindow):
     # Context menu action handlers
     def on_rename_database(self, database_name: str):
         """Handle rename database context menu action."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         logger.info(f"Opening rename database dialog for: {database_name}")
         
         if not self.mongo_service.is_connected():
@@ -1507,9 +1650,6 @@ class MainWindow(QMainWindow):
     
     def on_delete_database(self, database_name: str):
         """Handle delete database context menu action."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         logger.info(f"Opening delete database dialog for: {database_name}")
         
         if not self.mongo_service.is_connected():
@@ -1547,9 +1687,6 @@ class MainWindow(QMainWindow):
     
     def on_rename_collection(self, database_name: str, collection_name: str):
         """Handle rename collection context menu action."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         logger.info(f"Opening rename collection dialog for: {database_name}/{collection_name}")
         
         if not self.mongo_service.is_connected():
@@ -1609,9 +1746,6 @@ class MainWindow(QMainWindow):
     
     def on_delete_collection(self, database_name: str, collection_name: str):
         """Handle delete collection context menu action."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         logger.info(f"Opening delete collection dialog for: {database_name}/{collection_name}")
         
         if not self.mongo_service.is_connected():
@@ -1648,9 +1782,6 @@ class MainWindow(QMainWindow):
     
     def on_insert_document_from_context(self, database_name: str, collection_name: str):
         """Handle insert document from context menu action."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         # Set the current database and collection
         self.current_database = database_name
         self.current_collection = collection_name
@@ -1668,52 +1799,32 @@ class MainWindow(QMainWindow):
             "Use the Operations tab to insert your document."
         )
     
-    def on_view_document(self, document_data: dict):
+    def on_view_document(self, document: dict):
         """Handle view document context menu action."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        row = document_data.get("row", -1)
-        logger.info(f"View document requested for row {row}")
+        document_id = document.get("_id", "Unknown")
+        logger.info(f"View document requested for _id: {document_id}")
         
         if not self.current_database or not self.current_collection:
             MessageBoxHelper.warning(self, "Warning", "No collection selected.")
             return
         
-        # Get the document data for the selected row
-        document = self.document_view_manager.get_document_by_row(row)
-        if not document:
-            logger.error(f"No document found at row {row}")
-            MessageBoxHelper.warning(self, "Warning", "No document found at the selected row.")
-            return
-        
-        logger.info(f"Opening document viewer for document at row {row}")
+        logger.info(f"Opening document viewer for document with _id: {document_id}")
         
         # Create and show document viewer dialog
         from ..dialogs.dialogs import DocumentViewerDialog
         dialog = DocumentViewerDialog(document, self)
         dialog.exec()
     
-    def on_edit_document(self, document_data: dict):
+    def on_edit_document(self, document: dict):
         """Handle edit document context menu action."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        row = document_data.get("row", -1)
-        logger.info(f"Edit document requested for row {row}")
+        document_id = document.get("_id", "Unknown")
+        logger.info(f"Edit document requested for _id: {document_id}")
         
         if not self.current_database or not self.current_collection:
             MessageBoxHelper.warning(self, "Warning", "No collection selected.")
             return
         
-        # Get the document data for the selected row
-        document = self.document_view_manager.get_document_by_row(row)
-        if not document:
-            logger.error(f"No document found at row {row}")
-            MessageBoxHelper.warning(self, "Warning", "No document found at the selected row.")
-            return
-        
-        logger.info(f"Opening document editor for document at row {row}")
+        logger.info(f"Opening document editor for document with _id: {document_id}")
         
         # Create and show document editor dialog
         from ..dialogs.dialogs import EditDocumentDialog
@@ -1721,7 +1832,7 @@ class MainWindow(QMainWindow):
         if dialog.exec() == QDialog.Accepted:
             updated_document = dialog.get_document()
             if updated_document:
-                logger.info(f"User confirmed document edit for row {row}")
+                logger.info(f"User confirmed document edit for _id: {document_id}")
                 
                 # Update the document in MongoDB
                 try:
@@ -1738,11 +1849,11 @@ class MainWindow(QMainWindow):
                         )
                         
                         if success:
-                            logger.info(f"Successfully updated document at row {row}")
+                            logger.info(f"Successfully updated document with _id: {document_id}")
                             MessageBoxHelper.information(self, "Success", "Document updated successfully")
                             self.refresh_documents()
                         else:
-                            logger.error(f"Failed to update document at row {row}")
+                            logger.error(f"Failed to update document with _id: {document_id}")
                             MessageBoxHelper.critical(self, "Error", "Failed to update document")
                     else:
                         logger.error("No MongoDB client available")
@@ -1755,43 +1866,16 @@ class MainWindow(QMainWindow):
         else:
             logger.info("User cancelled document edit dialog")
     
-    def on_delete_document_from_context(self, document_data: dict):
+    def on_delete_document_from_context(self, document: dict):
         """Handle delete document from context menu action."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         if not self.current_database or not self.current_collection:
             MessageBoxHelper.warning(self, "Warning", "No collection selected.")
             return
         
-        # Handle both row-based (from DataTable) and index-based (from ObjectView) requests
-        row = document_data.get("row", -1)
-        index = document_data.get("index", -1)
-        
-        if row >= 0:
-            # DataTable context menu - get document by row
-            document = self.document_view_manager.get_document_by_row(row)
-            source_info = f"row {row}"
-            logger.info(f"Delete document requested for {source_info}")
-        elif index >= 0:
-            # ObjectView context menu - get document by index
-            document = self.document_view_manager.get_document_by_index(index)
-            source_info = f"index {index}"
-            logger.info(f"Delete document requested for {source_info}")
-        else:
-            logger.error("Invalid document data received: neither row nor index specified")
-            MessageBoxHelper.warning(self, "Warning", "Invalid document selection.")
-            return
-        
-        if not document:
-            logger.error(f"No document found at {source_info}")
-            MessageBoxHelper.warning(self, "Warning", f"No document found at {source_info}.")
-            return
-        
-        # Get the document _id
+        # Both the table and the object view emit the document itself
         document_id = document.get("_id")
         if not document_id:
-            logger.error(f"Document at {source_info} has no _id field")
+            logger.error("Document selected for deletion has no _id field")
             MessageBoxHelper.warning(self, "Warning", "Document has no _id field and cannot be deleted.")
             return
         
@@ -1801,12 +1885,11 @@ class MainWindow(QMainWindow):
             f"Are you sure you want to delete this document?\n\n"
             f"Database: {self.current_database}\n"
             f"Collection: {self.current_collection}\n"
-            f"Document ID: {document_id}\n"
-            f"Location: {source_info}\n\n"
+            f"Document ID: {document_id}\n\n"
             f"Document Preview:\n{document_preview}"
         )
         
-        logger.info(f"Attempting to delete document with _id: {document_id} from {source_info}")
+        logger.info(f"Attempting to delete document with _id: {document_id}")
         
         reply = MessageBoxHelper.question(
             self,
@@ -1815,7 +1898,7 @@ class MainWindow(QMainWindow):
         )
         
         if reply:
-            logger.info(f"User confirmed deletion of document with _id: {document_id} from {source_info}")
+            logger.info(f"User confirmed deletion of document with _id: {document_id}")
             
             # Delete the document from MongoDB
             success, message = self.mongo_service.delete_document_by_id(
@@ -1825,33 +1908,31 @@ class MainWindow(QMainWindow):
             )
             
             if success:
-                logger.info(f"Successfully deleted document with _id: {document_id} from {source_info}")
+                logger.info(f"Successfully deleted document with _id: {document_id}")
                 MessageBoxHelper.information(
                     self, 
                     "Success", 
                     f"Document deleted successfully.\n\n"
                     f"Database: {self.current_database}\n"
                     f"Collection: {self.current_collection}\n"
-                    f"Document ID: {document_id}\n"
-                    f"Location: {source_info}\n\n"
+                    f"Document ID: {document_id}\n\n"
                     f"{message}"
                 )
                 # Refresh the documents to update the view
                 self.refresh_documents()
             else:
-                logger.error(f"Failed to delete document with _id: {document_id} from {source_info} - {message}")
+                logger.error(f"Failed to delete document with _id: {document_id} - {message}")
                 MessageBoxHelper.critical(
                     self, 
                     "Error", 
                     f"Failed to delete document.\n\n"
                     f"Database: {self.current_database}\n"
                     f"Collection: {self.current_collection}\n"
-                    f"Document ID: {document_id}\n"
-                    f"Location: {source_info}\n\n"
+                    f"Document ID: {document_id}\n\n"
                     f"Error: {message}"
                 )
         else:
-            logger.info(f"User cancelled deletion of document with _id: {document_id} from {source_info}")
+            logger.info(f"User cancelled deletion of document with _id: {document_id}")
     
     def _create_document_preview(self, document: dict) -> str:
         """Create a preview of the document for confirmation dialogs."""
@@ -1880,16 +1961,11 @@ class MainWindow(QMainWindow):
             return "\n".join(preview_parts)
             
         except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.warning(f"Error creating document preview: {e}")
             return f"Error creating preview: {str(e)}"
     
     def on_insert_document(self):
         """Handle insert document toolbar action."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         if not self.mongo_service.is_connected():
             MessageBoxHelper.warning(self, "Warning", "Please connect to MongoDB first.")
             return
@@ -1969,9 +2045,6 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event):
         """Handle application close event."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         logger.info("Close event triggered")
         
         if self.mongo_service.is_connected():
@@ -1989,6 +2062,7 @@ class MainWindow(QMainWindow):
                 if reply:
                     logger.info("User confirmed exit, disconnecting MongoDB")
                     self.mongo_service.disconnect_from_mongodb()
+                    self._wait_for_workers()
                     logger.info("Calling event.accept()")
                     event.accept()
                 else:
@@ -2000,7 +2074,17 @@ class MainWindow(QMainWindow):
                 event.accept()
         else:
             logger.info("MongoDB not connected, accepting close event")
+            self._wait_for_workers()
             event.accept()
+    
+    def _wait_for_workers(self):
+        """Let background page fetches and counts finish before the window goes.
+        
+        A QThread destroyed while running aborts the process; once the client
+        is disconnected their queries fail fast.
+        """
+        for worker in list(self._prefetch_workers) + list(self._count_workers):
+            worker.wait()
 
     def on_export_database(self):
         """Export the entire selected database (all collections and documents)."""
@@ -0,0 +1 @@
+"""UI tests for the presentation layer."""
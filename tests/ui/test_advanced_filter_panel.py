@@ -0,0 +1,81 @@
+"""
+Filter building tests for the advanced filter panel.
+"""
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from presentation.panels.advanced_filter_panel import AdvancedFilterPanel
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def panel(qapp):
+    panel = AdvancedFilterPanel()
+    panel.applied = []
+    panel.filter_applied.connect(panel.applied.append)
+    yield panel
+    # Delete the widget tree before the panel object itself is collected
+    panel.widget.deleteLater()
+    qapp.processEvents()
+
+
+def test_basic_filters_combine_with_and(panel):
+    """Several basic filters are applied and shown as one $and query."""
+    panel.active_filters = [{"age": {"$gt": 18}}, {"name": "John"}]
+    panel._apply_filter()
+    
+    assert panel.applied == [{"$and": [{"age": {"$gt": 18}}, {"name": "John"}]}]
+    assert panel.get_current_filter() == '{"$and":[{"age":{"$gt":18}},{"name":"John"}]}'
+
+
+def test_current_filter_follows_removed_filters(panel):
+    """The shown query reflects filters removed since it was last read."""
+    panel.active_filters = [{"age": {"$gt": 18}}, {"name": "John"}]
+    panel._update_active_filters_display()
+    panel.get_current_filter()
+    panel._remove_filter(0)
+    
+    assert panel.get_current_filter() == '{"name":"John"}'
+    panel._remove_filter(0)
+    assert panel.get_current_filter() == ""
+
+
+@pytest.fixture
+def advanced_panel(panel):
+    panel.mode_tabs.setCurrentIndex(1)  # Builds the JSON editor
+    return panel
+
+
+@pytest.mark.parametrize("text, error", [
+    ('{"name": "John"}', False),
+    ('{"age": {"$gt": ', False),  # Still being typed
+    ('{"age": 1,}', True),
+    ('[{"name": "John"}]', True),
+    ('"John"', True),
+])
+def test_validator_marks_invalid_json(advanced_panel, text, error):
+    """Errors are flagged as soon as the text is checked, without a deferred call."""
+    advanced_panel.json_editor.setPlainText(text)
+    advanced_panel._validate_json()
+    
+    assert (advanced_panel.syntax_highlighter.error_line >= 0) == error
+
+
+@pytest.mark.parametrize("text", ['[{"name": "John"}]', '"John"', '42'])
+def test_apply_rejects_non_object_filters(advanced_panel, text):
+    """JSON that is not an object is reported and never applied."""
+    advanced_panel.json_editor.setPlainText(text)
+    advanced_panel._apply_filter()
+    
+    assert advanced_panel.applied == []
+    assert advanced_panel._status_label.text() == "Filter must be a JSON object"
@@ -0,0 +1,235 @@
+"""
+Paging tests for the main window's document views.
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from business.pagination_manager import id_sort_bracket
+from presentation.windows.main_window import MainWindow
+
+# MongoDB's sort order of the type brackets the tests use
+BRACKET_ORDER = ["number", "string"]
+
+
+def _sort_key(value):
+    return BRACKET_ORDER.index(id_sort_bracket(value)), value
+
+
+def _compares(value, bound):
+    """Ranges only match values in the bound's own type bracket, as in MongoDB."""
+    return id_sort_bracket(value) == id_sort_bracket(bound)
+
+
+def _matches(document, query):
+    """Evaluate the small subset of MongoDB filters the tests use."""
+    for field, condition in query.items():
+        if field == "$and":
+            if not all(_matches(document, part) for part in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = document.get(field)
+            if "$gt" in condition and not (_compares(value, condition["$gt"]) and value > condition["$gt"]):
+                return False
+            if "$gte" in condition and not (_compares(value, condition["$gte"]) and value >= condition["$gte"]):
+                return False
+        elif document.get(field) != condition:
+            return False
+    return True
+
+
+class FakeMongoService:
+    """Stands in for MongoService with a collection of numbered documents."""
+    
+    def __init__(self, total: int = 120):
+        self.documents = [{"_id": i, "value": i} for i in range(total)]
+        self.find_calls = []
+        self.estimated_count = None  # Unfiltered count reported unless exact
+    
+    def find_documents(self, database_name, collection_name, query=None, limit=100, skip=0, sort=None):
+        self.find_calls.append({"query": query, "limit": limit, "skip": skip})
+        documents = [doc for doc in self.documents if not query or _matches(doc, query)]
+        if sort:
+            field, direction = sort[0]
+            documents.sort(key=lambda doc: _sort_key(doc[field]), reverse=direction < 0)
+        return [dict(doc) for doc in documents[skip:skip + limit]]
+    
+    def count_documents(self, database_name, collection_name, query=None, exact=False):
+        if not query and not exact and self.estimated_count is not None:
+            return self.estimated_count
+        return sum(1 for doc in self.documents if not query or _matches(doc, query))
+    
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def window(qapp):
+    window = MainWindow()
+    window.mongo_service = FakeMongoService()
+    window.current_database = "db"
+    window.current_collection = "items"
+    window.document_view_manager.set_collection_info("items", len(window.mongo_service.documents))
+    yield window
+    for worker in list(window._prefetch_workers) + list(window._count_workers):
+        worker.wait()
+    window.close()
+
+
+def test_refresh_drops_cached_pages(window):
+    """Pages cached before a refresh are fetched again afterwards."""
+    service = window.mongo_service
+    data_table = window.document_view_manager.data_table
+    window.refresh_documents()
+    data_table._go_to_page(2)
+    data_table._go_to_page(1)
+    assert window.document_view_manager.pagination_manager.is_page_cached(2)
+    
+    # Delete a document from page 1; page 2 now starts one document earlier
+    del service.documents[0]
+    window.refresh_documents()
+    calls_before = len(service.find_calls)
+    data_table._go_to_page(2)
+    
+    assert len(service.find_calls) == calls_before + 1
+    assert window.document_view_manager.current_documents[0]["_id"] == 51
+
+
+def test_filter_pages_through_all_matches(window):
+    """A filter shows its match count and pages without repeating rows."""
+    manager = window.document_view_manager
+    window.execute_advanced_filter({"value": {"$gte": 10}})
+    
+    assert manager.total_documents == 110
+    first_page = [doc["_id"] for doc in manager.current_documents]
+    assert first_page == list(range(10, 60))
+    
+    manager.data_table._go_to_page(2)
+    second_page = [doc["_id"] for doc in manager.current_documents]
+    assert second_page == list(range(60, 110))
+    
+    # Resetting the filter restores the collection's own total
+    window.reset_advanced_filter()
+    assert manager.total_documents == 120
+
+
+def _finish_prefetches(qapp, window):
+    """Wait for background page fetches and counts and deliver their results."""
+    for worker in list(window._prefetch_workers) + list(window._count_workers):
+        worker.wait()
+    qapp.processEvents()
+
+
+def test_prefetch_stores_next_filtered_page(qapp, window):
+    """The prefetched page follows the filtered first page."""
+    manager = window.document_view_manager
+    window.execute_advanced_filter({"value": {"$gte": 10}})
+    qapp.processEvents()  # Runs the scheduled prefetch
+    _finish_prefetches(qapp, window)
+    
+    cached = manager.pagination_manager.get_cached_page(2)
+    assert [doc["_id"] for doc in cached] == list(range(60, 110))
+
+
+def test_prefetch_discarded_after_filter_change(qapp, window):
+    """A page fetched for an earlier filter is not cached under a new one."""
+    manager = window.document_view_manager
+    window.execute_advanced_filter({"value": {"$gte": 10}})
+    qapp.processEvents()  # Starts the prefetch for the first filter
+    window.execute_advanced_filter({"value": {"$gte": 20}})
+    _finish_prefetches(qapp, window)
+    
+    cached = manager.pagination_manager.get_cached_page(2)
+    assert cached is None or [doc["_id"] for doc in cached] == list(range(70, 120))
+
+
+def test_cursor_pages_include_every_id_type(window):
+    """With mixed _id types, page 2 is fetched with skip and spans both types."""
+    service = window.mongo_service
+    manager = window.document_view_manager
+    service.documents = (
+        [{"_id": i, "value": i} for i in range(60)]
+        + [{"_id": f"s{i:02d}", "value": i} for i in range(40)]
+    )
+    manager.set_collection_info("items", len(service.documents))
+    
+    window.refresh_documents()
+    manager.data_table._go_to_page(2)
+    paged = [doc["_id"] for doc in manager.current_documents]
+    
+    assert service.find_calls[-1]["skip"] == 50
+    assert paged[:10] == list(range(50, 60))
+    assert paged[10:] == [f"s{i:02d}" for i in range(40)]
+
+
+def test_cursor_used_when_ids_share_one_type(window):
+    """Uniform numeric _ids let page 2 start after page 1's last _id."""
+    service = window.mongo_service
+    manager = window.document_view_manager
+    window.refresh_documents()
+    manager.data_table._go_to_page(2)
+    
+    assert service.find_calls[-1]["query"] == {"_id": {"$gt": 49}}
+    assert service.find_calls[-1]["skip"] == 0
+    assert manager.current_documents[0]["_id"] == 50
+
+
+def test_exact_count_replaces_estimate(qapp, window):
+    """A stale metadata count is corrected once the first page is shown."""
+    manager = window.document_view_manager
+    window.mongo_service.estimated_count = 100
+    window.refresh_documents()
+    assert manager.total_documents == 100
+    
+    _finish_prefetches(qapp, window)
+    assert manager.total_documents == 120
+
+
+def test_exact_count_discarded_after_filter(qapp, window):
+    """A count that finishes after a filter was applied keeps the match count."""
+    manager = window.document_view_manager
+    window.mongo_service.estimated_count = 100
+    window.refresh_documents()
+    window.execute_advanced_filter({"value": {"$gte": 10}})
+    
+    _finish_prefetches(qapp, window)
+    assert manager.total_documents == 110
+
+
+def test_failed_filter_keeps_previous_filter(window):
+    """A filter the database rejects does not replace the one pages use."""
+    manager = window.document_view_manager
+    window.execute_advanced_filter({"value": {"$gte": 10}})
+    query = manager.current_query
+    
+    def fail(*args, **kwargs):
+        raise RuntimeError("unknown operator: $bad")
+    
+    window.mongo_service.count_documents = fail
+    with patch("presentation.windows.main_window.MessageBoxHelper"):
+        window.execute_advanced_filter({"value": {"$bad": 1}})
+    
+    assert window.current_filter == {"value": {"$gte": 10}}
+    assert manager.current_query == query
+
+
+def test_last_page_ignores_inexact_total(window):
+    """Late pages come from the documents themselves, not from the total."""
+    manager = window.document_view_manager
+    window.refresh_documents()
+    # The unfiltered total is an estimate until the exact count arrives
+    manager.set_document_count(135)
+    
+    manager.data_table._go_to_page(3)
+    assert [doc["_id"] for doc in manager.current_documents] == list(range(100, 120))
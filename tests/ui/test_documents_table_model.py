@@ -0,0 +1,73 @@
+"""
+Formatting and cell text cache tests for the documents table model.
+"""
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from presentation.panels.data_table import DocumentsTableModel, _format_str
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def model(qapp):
+    model = DocumentsTableModel()
+    documents = [{"_id": i, "name": f"doc {i}", "tags": [i]} for i in range(3)]
+    model.set_documents(documents, ["_id", "name", "tags"])
+    return model
+
+
+def _texts(model):
+    return [
+        [model.data(model.index(row, column)) for column in range(model.columnCount())]
+        for row in range(model.rowCount())
+    ]
+
+
+def test_format_str_truncates_long_values():
+    """Long strings are cut to 50 characters; short ones are kept."""
+    assert _format_str("short") == "short"
+    assert _format_str("x" * 80) == "x" * 47 + "..."
+
+
+def test_remove_row_drops_cached_text(model):
+    """A removed document leaves nothing behind in the cell caches."""
+    _texts(model)  # Caches the text of every cell
+    removed = model._docs[1]
+    
+    assert model.remove_row(1)
+    assert all(key[0] != id(removed) for key in model._text_cache)
+    assert _texts(model) == [["0", "doc 0", "[ 1 items ]"], ["2", "doc 2", "[ 1 items ]"]]
+    assert not model.remove_row(5)
+
+
+def test_append_documents_adds_rows_and_columns(model):
+    """Appended documents show up with their new fields as extra columns."""
+    _texts(model)
+    model.append_documents([{"_id": 3, "name": "doc 3", "extra": True}], ["extra"])
+    
+    assert model.fields() == ["_id", "name", "tags", "extra"]
+    texts = _texts(model)
+    assert texts[0] == ["0", "doc 0", "[ 1 items ]", ""]
+    assert texts[3] == ["3", "doc 3", "", "true"]
+
+
+def test_set_documents_drops_text_of_replaced_documents(model):
+    """New documents never get the cached text of the ones they replace."""
+    _texts(model)
+    model.append_documents([{"_id": 3, "name": "doc 3"}], [])
+    _texts(model)
+    
+    model.set_documents([{"_id": 9, "name": "other"}], ["_id", "name"])
+    
+    assert _texts(model) == [["9", "other"]]
+    assert set(model._text_cache) == {(id(model._docs[0]), "_id"), (id(model._docs[0]), "name")}
@@ -0,0 +1,49 @@
+"""
+Selection tests for the object view of the document view manager.
+"""
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from presentation.panels.document_view_manager import DocumentViewManager
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def manager(qapp):
+    manager = DocumentViewManager()
+    manager._switch_view("object")
+    manager.populate_documents([{"_id": i, "value": i} for i in range(3)])
+    return manager
+
+
+def test_delete_request_selects_document(manager):
+    """Asking to delete a document makes it the selected one."""
+    object_view = manager.object_view
+    requested = []
+    object_view.delete_document_requested.connect(requested.append)
+    
+    object_view.document_widgets[1]._handle_delete_document()
+    
+    assert requested == [{"_id": 1, "value": 1}]
+    assert object_view.get_selected_index() == 1
+    assert object_view.get_selected_document() == {"_id": 1, "value": 1}
+
+
+def test_remove_selected_row_in_object_view(manager):
+    """The document asked to be deleted is the one removed from the view."""
+    manager.object_view.document_widgets[1]._handle_delete_document()
+    
+    assert manager.remove_selected_row()
+    assert [doc["_id"] for doc in manager.current_documents] == [0, 2]
+    assert manager.object_view.get_selected_index() is None
+    assert not manager.remove_selected_row()